@@ -1,16 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Header, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-from typing import Optional
+from sqlalchemy import select, insert, and_, bindparam
+from sqlalchemy.orm import selectinload, raiseload
+from typing import Optional, AsyncIterator
+from functools import lru_cache
 from uuid import UUID
 from datetime import datetime
-import time
+import asyncio
+import hashlib
+import re
+
+import orjson
 
 from app.db.base import get_db
 from app.models.user import User
 from app.models.contract import Contract, ContractDocument
-from app.models.analysis import AIAnalysis, AnalysisClause, AnalysisQuestion, AnalysisStatus, RiskLevel
+from app.models.analysis import AIAnalysis, AnalysisStatus
 from app.schemas.analysis import (
     AnalyzeRequest,
     AnalysisResponse,
@@ -18,126 +24,62 @@ from app.schemas.analysis import (
     AnalysisStartResponse
 )
 from app.api.auth import get_current_user
-from app.services.ai_analyzer import analyze_contract_text
+from app.services.analysis_worker import get_analysis_worker, AnalysisWorker
 from app.services.gemini import get_gemini_client, GeminiClient
 from app.core.config import settings
+from app.core.exceptions import AIServiceError
+from app.core.logging import get_logger
+from app.utils.lru_cache import LRUCache
 from pydantic import BaseModel, Field
 
 router = APIRouter(prefix="/ai", tags=["AI Analysis"])
-
-
-async def run_analysis(
-    analysis_id: UUID,
-    contract_text: str,
-    user_context: str,
-    db: AsyncSession
-):
-    """Background task to run AI analysis."""
-    start_time = time.time()
-
-    try:
-        # Get analysis record
-        result = await db.execute(
-            select(AIAnalysis).where(AIAnalysis.id == analysis_id)
-        )
-        analysis = result.scalar_one_or_none()
-
-        if analysis is None:
-            return
-
-        # Update status to processing
-        analysis.status = AnalysisStatus.PROCESSING
-        await db.flush()
-
-        # Run AI analysis
-        ai_result = await analyze_contract_text(contract_text, user_context)
-
-        # Update analysis with results
-        analysis.safety_score = ai_result.get("score", 0)
-        analysis.summary = ai_result.get("summary", "")
-        analysis.status = AnalysisStatus.COMPLETED
-        analysis.completed_at = datetime.utcnow()
-        analysis.processing_time_ms = int((time.time() - start_time) * 1000)
-        analysis.model_version = ai_result.get("model", "gemini-2.0-flash")
-
-        # Add risk clauses
-        for idx, risk in enumerate(ai_result.get("risks", [])):
-            clause = AnalysisClause(
-                analysis_id=analysis.id,
-                clause_text=risk.get("title", ""),
-                risk_level=RiskLevel(risk.get("level", "caution").lower()),
-                explanation=risk.get("description", ""),
-                suggestion=risk.get("suggestion", ""),
-                display_order=idx
-            )
-            db.add(clause)
-
-        # Add recommended questions
-        for idx, question in enumerate(ai_result.get("questions", [])):
-            q = AnalysisQuestion(
-                analysis_id=analysis.id,
-                question=question,
-                priority=len(ai_result.get("questions", [])) - idx
-            )
-            db.add(q)
-
-        await db.commit()
-
-    except Exception as e:
-        # Update status to failed
-        result = await db.execute(
-            select(AIAnalysis).where(AIAnalysis.id == analysis_id)
-        )
-        analysis = result.scalar_one_or_none()
-
-        if analysis:
-            analysis.status = AnalysisStatus.FAILED
-            analysis.error_message = str(e)
-            await db.commit()
+logger = get_logger("analysis")
 
 
 @router.post("/analyze", response_model=AnalysisStartResponse)
 async def start_analysis(
     request: AnalyzeRequest,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    analysis_worker: AnalysisWorker = Depends(get_analysis_worker)
 ):
     """Start AI analysis for a contract."""
+    # Only the document being analyzed is needed: the requested one, or the
+    # latest version. Outer join so a missing document is told apart from a
+    # missing contract.
+    if request.document_id:
+        document_filter = ContractDocument.id == request.document_id
+    else:
+        document_filter = ContractDocument.is_latest.is_(True)
+
     # Verify contract ownership
     result = await db.execute(
-        select(Contract)
-        .options(selectinload(Contract.documents))
+        select(Contract.id, ContractDocument.id, ContractDocument.ocr_text)
+        .outerjoin(
+            ContractDocument,
+            and_(ContractDocument.contract_id == Contract.id, document_filter)
+        )
         .where(Contract.id == request.contract_id)
         .where(Contract.user_id == current_user.id)
+        .limit(1)
     )
-    contract = result.scalar_one_or_none()
+    row = result.first()
 
-    if contract is None:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contract not found"
         )
 
-    # Get document text
-    document = None
-    if request.document_id:
-        for doc in contract.documents:
-            if doc.id == request.document_id:
-                document = doc
-                break
-    else:
-        # Get latest document
-        latest_docs = [d for d in contract.documents if d.is_latest]
-        document = latest_docs[0] if latest_docs else None
+    contract_id, document_id, ocr_text = row
 
-    if document is None:
+    if document_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No document found for analysis"
         )
 
-    contract_text = document.ocr_text or ""
+    contract_text = ocr_text or ""
 
     if not contract_text:
         raise HTTPException(
@@ -154,97 +96,156 @@ async def start_analysis(
         Known concerns: {current_user.legal_concerns or 'Not specified'}
         """
 
-    # Create analysis record
-    analysis = AIAnalysis(
-        contract_id=contract.id,
-        document_id=document.id,
-        status=AnalysisStatus.PENDING,
-        user_context=user_context
-    )
-    db.add(analysis)
-    await db.flush()
-    await db.refresh(analysis)
-
-    # Start background analysis
-    background_tasks.add_task(
-        run_analysis,
-        analysis.id,
-        contract_text,
-        user_context,
-        db
+    # Create analysis record; RETURNING hands back the generated id in the
+    # same round-trip, so no flush/refresh of an ORM instance is needed
+    result = await db.execute(
+        insert(AIAnalysis)
+        .values(
+            contract_id=contract_id,
+            document_id=document_id,
+            status=AnalysisStatus.PENDING,
+            user_context=user_context
+        )
+        .returning(AIAnalysis.id)
     )
+    analysis_id = result.scalar_one()
+
+    # Commit so the worker's own session can see the record
+    await db.commit()
+
+    # Queue for background analysis
+    await analysis_worker.enqueue(analysis_id, contract_text, user_context)
 
     return AnalysisStartResponse(
-        analysis_id=analysis.id,
+        analysis_id=analysis_id,
         status="processing",
         message="Analysis started. Check status using GET /ai/analysis/{id}",
-        websocket_channel=f"analysis_{analysis.id}"
+        websocket_channel=f"analysis_{analysis_id}"
     )
 
 
+# Polled on every status check, so statement and loader options are built
+# once at import rather than per request
+SELECT_ANALYSIS_DETAIL = (
+    select(AIAnalysis)
+    .options(
+        selectinload(AIAnalysis.clauses),
+        selectinload(AIAnalysis.questions),
+        raiseload("*")
+    )
+    .where(AIAnalysis.id == bindparam("analysis_id"))
+)
+SELECT_CONTRACT_ANALYSES = (
+    select(AIAnalysis)
+    .options(raiseload("*"))
+    .where(AIAnalysis.contract_id == bindparam("contract_id"))
+    .order_by(AIAnalysis.created_at.desc())
+)
+
+
+def build_etag(*parts) -> str:
+    """Build a weak ETag from the values that determine a response body."""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=16)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
 @router.get("/analysis/{analysis_id}", response_model=AnalysisDetailResponse)
 async def get_analysis(
     analysis_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get analysis results."""
+    """
+    Get analysis results.
+
+    Clients polling for completion should send If-None-Match; an unchanged
+    analysis returns 304 without loading clauses and questions.
+    """
+    # Lightweight lookup for ownership and ETag
     result = await db.execute(
-        select(AIAnalysis)
-        .options(
-            selectinload(AIAnalysis.clauses),
-            selectinload(AIAnalysis.questions),
-            selectinload(AIAnalysis.contract)
-        )
+        select(AIAnalysis.status, AIAnalysis.completed_at, Contract.user_id)
+        .join(Contract, AIAnalysis.contract_id == Contract.id)
         .where(AIAnalysis.id == analysis_id)
     )
-    analysis = result.scalar_one_or_none()
+    row = result.first()
 
-    if analysis is None:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Analysis not found"
         )
 
+    analysis_status, completed_at, owner_id = row
+
     # Verify ownership
-    if analysis.contract.user_id != current_user.id:
+    if owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied"
         )
 
+    etag = build_etag(analysis_id, analysis_status.value, completed_at)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    result = await db.execute(SELECT_ANALYSIS_DETAIL, {"analysis_id": analysis_id})
+    analysis = result.scalar_one_or_none()
+
+    if analysis is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Analysis not found"
+        )
+
+    response.headers["ETag"] = etag
     return analysis
 
 
 @router.get("/contract/{contract_id}/analyses", response_model=list[AnalysisResponse])
 async def list_contract_analyses(
     contract_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """List all analyses for a contract."""
     # Verify contract ownership
     result = await db.execute(
-        select(Contract)
+        select(Contract.id)
         .where(Contract.id == contract_id)
         .where(Contract.user_id == current_user.id)
     )
-    contract = result.scalar_one_or_none()
 
-    if contract is None:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contract not found"
         )
 
     # Get analyses
-    result = await db.execute(
-        select(AIAnalysis)
-        .where(AIAnalysis.contract_id == contract_id)
-        .order_by(AIAnalysis.created_at.desc())
-    )
+    result = await db.execute(SELECT_CONTRACT_ANALYSES, {"contract_id": contract_id})
     analyses = result.scalars().all()
 
+    # Rows are small, so the ETag is derived from them directly; a match
+    # saves serialization and transfer of the unchanged list
+    etag = build_etag(*(
+        f"{a.id}:{a.status.value}:{a.completed_at}" for a in analyses
+    ))
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     return analyses
 
 
@@ -311,8 +312,9 @@ async def quick_analyze(
     return QuickAnalysisResponse(
         score=result.score,
         summary=result.summary,
+        # Risk items come from our own GeminiClient, so skip re-validation
         risks=[
-            RiskItemResponse(
+            RiskItemResponse.model_construct(
                 id=r.id,
                 title=r.title,
                 description=r.description,
@@ -343,6 +345,150 @@ async def ai_health_check(
 # ==================== Additional AI Proxy Endpoints ====================
 # These endpoints proxy AI calls through the backend for security
 
+# Prompt templates
+CHAT_SYSTEM_INSTRUCTION = """You are a helpful AI legal assistant for the Korean legal system.
+    You provide information about Korean laws, regulations, and legal procedures.
+    Always clarify that you are providing general information, not legal advice.
+    Always respond in Korean unless the user writes in English.
+    """
+
+CHAT_PROFILE_TEMPLATE = """
+        [USER PROFILE CONTEXT]
+        - Name: {name}
+        - Job/Business: {business_type}
+        - Description: {business_description}
+        - Known Legal Concerns: {legal_concerns}
+
+        Tailor your advice to be relevant to their business type.
+        """
+
+SUMMARIZE_LANGUAGE_INSTRUCTIONS = {
+    "ko": "Respond in Korean.",
+    "en": "Respond in English.",
+}
+
+SUMMARIZE_PROMPT_TEMPLATE = """Summarize the following document.
+    {lang_instruction}
+
+    Document:
+    {document}
+
+    Provide:
+    1. A concise summary (2-3 paragraphs)
+    2. Key points (5-7 bullet points)
+
+    Format as JSON:
+    {{
+        "summary": "...",
+        "key_points": ["point 1", "point 2", ...]
+    }}
+    """
+
+PROOF_PROMPT_TEMPLATE = """Generate a formal proof statement for the following content.
+    Content type: {proof_type}
+    Timestamp: {timestamp}
+    Content hash: {content_hash}
+
+    Content preview (first 500 chars):
+    {content_preview}
+
+    Generate a formal verification statement in Korean that confirms:
+    1. The content existed at the specified timestamp
+    2. The content hash for verification
+    3. Any relevant metadata
+
+    Keep the response concise and formal.
+    """
+
+NEGOTIATION_PROMPT_TEMPLATE = """You are a negotiation coach helping a freelancer/small business owner.
+
+Based on this contract risk:
+- Title: {risk_title}
+- Description: {risk_description}
+- Risk Level: {risk_level}
+
+Contract context: {contract_context}
+
+Provide a polite but firm negotiation script in Korean that the user can use to discuss this issue with the other party. Include:
+1. Opening statement
+2. Specific request for change
+3. Reasonable alternative suggestion
+4. Professional closing
+
+Keep it under 200 words.
+"""
+
+
+# Strips an optional ```json ... ``` fence around a model response
+MARKDOWN_FENCE_PATTERN = re.compile(r"^\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL)
+
+# Summaries keyed by (document digest, summary_type, language); viewers
+# re-open the same documents and each miss costs a full Gemini round-trip
+summarize_cache = LRUCache(maxsize=1024)
+
+# Prompt input limits: summaries see at most this much of the document,
+# proofs embed only a short preview of the content
+SUMMARIZE_MAX_CHARS = 10000
+PROOF_PREVIEW_CHARS = 500
+
+# Chunk size for incremental hashing of large proof content
+HASH_CHUNK_SIZE = 1 << 20  # 1MB
+
+# Payloads above this size are parsed/hashed in a worker thread so they
+# don't stall the event loop; smaller ones are cheaper to handle inline
+CPU_OFFLOAD_THRESHOLD = 64 * 1024
+
+
+def sha256_hexdigest(data: bytes) -> str:
+    """SHA-256 hex digest, fed in chunks so large payloads aren't sliced into copies."""
+    digest = hashlib.sha256()
+    view = memoryview(data)
+    for offset in range(0, len(view), HASH_CHUNK_SIZE):
+        digest.update(view[offset:offset + HASH_CHUNK_SIZE])
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def build_chat_system_instruction(
+    name: str,
+    business_type: str,
+    business_description: str,
+    legal_concerns: str
+) -> str:
+    """Build the chat system instruction for a user profile (cached per profile)."""
+    return CHAT_SYSTEM_INSTRUCTION + CHAT_PROFILE_TEMPLATE.format(
+        name=name,
+        business_type=business_type,
+        business_description=business_description,
+        legal_concerns=legal_concerns
+    )
+
+
+# Headers for Server-Sent Events; X-Accel-Buffering stops nginx from
+# holding chunks back until the response completes
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+async def sse_stream(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """
+    Wrap model text chunks as Server-Sent Events frames.
+
+    Each chunk is sent as ``data: {"text": ...}``. Headers are already
+    sent once streaming starts, so failures are reported in-band as an
+    ``error`` event. The stream always ends with a ``done`` event.
+    """
+    try:
+        async for text in chunks:
+            yield b"data: " + orjson.dumps({"text": text}) + b"\n\n"
+    except AIServiceError as e:
+        logger.error(f"AI stream aborted: {e.message}")
+        yield b"event: error\ndata: " + orjson.dumps({"message": e.message}) + b"\n\n"
+    yield b"event: done\ndata: {}\n\n"
+
+
 class ChatMessage(BaseModel):
     """Chat message for conversation."""
     role: str = Field(..., description="Message role: user or assistant")
@@ -372,29 +518,10 @@ async def ai_chat(
 
     Proxies chat requests through the backend for security.
     """
-    # Build system instruction with user context
-    system_instruction = """You are a helpful AI legal assistant for the Korean legal system.
-    You provide information about Korean laws, regulations, and legal procedures.
-    Always clarify that you are providing general information, not legal advice.
-    Always respond in Korean unless the user writes in English.
-    """
-
-    if request.user_profile:
-        profile = request.user_profile
-        system_instruction += f"""
-        [USER PROFILE CONTEXT]
-        - Name: {profile.get('name', 'User')}
-        - Job/Business: {profile.get('businessType', 'Not specified')}
-        - Description: {profile.get('businessDescription', 'Not specified')}
-        - Known Legal Concerns: {profile.get('legalConcerns', 'Not specified')}
-
-        Tailor your advice to be relevant to their business type.
-        """
-
     response_text = await gemini.chat(
         message=request.message,
         history=[(msg.role, msg.text) for msg in request.history],
-        system_instruction=system_instruction
+        system_instruction=resolve_chat_system_instruction(request)
     )
 
     return ChatResponse(
@@ -403,6 +530,44 @@ async def ai_chat(
     )
 
 
+@router.post("/chat/stream")
+async def ai_chat_stream(
+    request: ChatRequest,
+    gemini: GeminiClient = Depends(get_gemini_client)
+):
+    """
+    Streaming variant of /chat.
+
+    Emits the reply as Server-Sent Events while Gemini generates it.
+    """
+    chunks = gemini.chat_stream(
+        message=request.message,
+        history=[(msg.role, msg.text) for msg in request.history],
+        system_instruction=resolve_chat_system_instruction(request)
+    )
+
+    return StreamingResponse(
+        sse_stream(chunks),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+def resolve_chat_system_instruction(request: ChatRequest) -> str:
+    """Build system instruction with user context."""
+    if not request.user_profile:
+        return CHAT_SYSTEM_INSTRUCTION
+
+    profile = request.user_profile
+    # str() keeps the cache key hashable for arbitrary JSON values
+    return build_chat_system_instruction(
+        str(profile.get('name', 'User')),
+        str(profile.get('businessType', 'Not specified')),
+        str(profile.get('businessDescription', 'Not specified')),
+        str(profile.get('legalConcerns', 'Not specified'))
+    )
+
+
 class SummarizeRequest(BaseModel):
     """Request for document summarization."""
     document_text: str = Field(..., min_length=10, description="Document text to summarize")
@@ -427,46 +592,36 @@ async def summarize_document(
 
     Useful for document viewer to get quick summaries.
     """
-    lang_instruction = "Respond in Korean." if request.language == "ko" else "Respond in English."
-
-    prompt = f"""Summarize the following document.
-    {lang_instruction}
-
-    Document:
-    {request.document_text[:10000]}
-
-    Provide:
-    1. A concise summary (2-3 paragraphs)
-    2. Key points (5-7 bullet points)
-
-    Format as JSON:
-    {{
-        "summary": "...",
-        "key_points": ["point 1", "point 2", ...]
-    }}
-    """
+    document = request.document_text[:SUMMARIZE_MAX_CHARS]
+    cache_key = (
+        hashlib.blake2b(document.encode(), digest_size=16).hexdigest(),
+        request.summary_type,
+        request.language
+    )
+    cached = summarize_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    response_text = await gemini.generate(prompt)
+    response_text = await gemini.generate(build_summarize_prompt(document, request.language))
 
     # Parse response
     try:
-        import json
         # Remove markdown code blocks if present
-        clean_text = response_text.strip()
-        if clean_text.startswith("```json"):
-            clean_text = clean_text[7:]
-        if clean_text.startswith("```"):
-            clean_text = clean_text[3:]
-        if clean_text.endswith("```"):
-            clean_text = clean_text[:-3]
-
-        result = json.loads(clean_text)
-        return SummarizeResponse(
+        clean_text = MARKDOWN_FENCE_PATTERN.match(response_text).group(1)
+
+        if len(clean_text) > CPU_OFFLOAD_THRESHOLD:
+            result = await asyncio.to_thread(orjson.loads, clean_text)
+        else:
+            result = orjson.loads(clean_text)
+        response = SummarizeResponse(
             summary=result.get("summary", "Summary not available"),
             key_points=result.get("key_points", []),
             model="gemini-2.0-flash-exp"
         )
-    except json.JSONDecodeError:
+        # Only parsed summaries are cached; unparseable output may succeed on retry
+        summarize_cache.set(cache_key, response)
+        return response
+    except orjson.JSONDecodeError:
         return SummarizeResponse(
             summary=response_text[:500],
             key_points=[],
@@ -474,6 +629,38 @@ async def summarize_document(
         )
 
 
+@router.post("/summarize/stream")
+async def summarize_document_stream(
+    request: SummarizeRequest,
+    gemini: GeminiClient = Depends(get_gemini_client)
+):
+    """
+    Streaming variant of /summarize.
+
+    Emits the raw model output (the JSON summary as it is generated) as
+    Server-Sent Events; the client parses it once the stream is done.
+    """
+    prompt = build_summarize_prompt(request.document_text[:SUMMARIZE_MAX_CHARS], request.language)
+
+    return StreamingResponse(
+        sse_stream(gemini.generate_stream(prompt)),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+def build_summarize_prompt(document: str, language: str) -> str:
+    """Build the summarization prompt for a (truncated) document."""
+    lang_instruction = SUMMARIZE_LANGUAGE_INSTRUCTIONS.get(
+        language, SUMMARIZE_LANGUAGE_INSTRUCTIONS["en"]
+    )
+
+    return SUMMARIZE_PROMPT_TEMPLATE.format(
+        lang_instruction=lang_instruction,
+        document=document
+    )
+
+
 class ProofRequest(BaseModel):
     """Request for content proof generation."""
     content: str = Field(..., min_length=10, description="Content to generate proof for")
@@ -499,28 +686,21 @@ async def generate_proof(
 
     Creates a verification statement for the content.
     """
-    import hashlib
-    from datetime import datetime
-
     # Generate content hash
-    content_hash = hashlib.sha256(request.content.encode()).hexdigest()
+    content = request.content.encode()
+    if len(content) > CPU_OFFLOAD_THRESHOLD:
+        content_hash = await asyncio.to_thread(sha256_hexdigest, content)
+    else:
+        content_hash = sha256_hexdigest(content)
     timestamp = datetime.utcnow().isoformat() + "Z"
+    content_preview = request.content[:PROOF_PREVIEW_CHARS]
 
-    prompt = f"""Generate a formal proof statement for the following content.
-    Content type: {request.proof_type}
-    Timestamp: {timestamp}
-    Content hash: {content_hash}
-
-    Content preview (first 500 chars):
-    {request.content[:500]}
-
-    Generate a formal verification statement in Korean that confirms:
-    1. The content existed at the specified timestamp
-    2. The content hash for verification
-    3. Any relevant metadata
-
-    Keep the response concise and formal.
-    """
+    prompt = PROOF_PROMPT_TEMPLATE.format(
+        proof_type=request.proof_type,
+        timestamp=timestamp,
+        content_hash=content_hash,
+        content_preview=content_preview
+    )
 
     response_text = await gemini.generate(prompt)
 
@@ -554,27 +734,34 @@ async def get_negotiation_script(
     """
     Generate a negotiation script for a specific contract risk.
     """
-    prompt = f"""You are a negotiation coach helping a freelancer/small business owner.
+    response_text = await gemini.generate(build_negotiation_prompt(request))
 
-Based on this contract risk:
-- Title: {request.risk_title}
-- Description: {request.risk_description}
-- Risk Level: {request.risk_level}
+    return NegotiationScriptResponse(
+        script=response_text,
+        model="gemini-2.0-flash-exp"
+    )
 
-Contract context: {request.contract_context}
 
-Provide a polite but firm negotiation script in Korean that the user can use to discuss this issue with the other party. Include:
-1. Opening statement
-2. Specific request for change
-3. Reasonable alternative suggestion
-4. Professional closing
-
-Keep it under 200 words.
-"""
+@router.post("/negotiation-script/stream")
+async def get_negotiation_script_stream(
+    request: NegotiationScriptRequest,
+    gemini: GeminiClient = Depends(get_gemini_client)
+):
+    """
+    Streaming variant of /negotiation-script, emitted as Server-Sent Events.
+    """
+    return StreamingResponse(
+        sse_stream(gemini.generate_stream(build_negotiation_prompt(request))),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
 
-    response_text = await gemini.generate(prompt)
 
-    return NegotiationScriptResponse(
-        script=response_text,
-        model="gemini-2.0-flash-exp"
+def build_negotiation_prompt(request: NegotiationScriptRequest) -> str:
+    """Build the negotiation coaching prompt for a contract risk."""
+    return NEGOTIATION_PROMPT_TEMPLATE.format(
+        risk_title=request.risk_title,
+        risk_description=request.risk_description,
+        risk_level=request.risk_level,
+        contract_context=request.contract_context
     )
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, status, Request, Response, Cookie
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, update, bindparam, inspect
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import raiseload, make_transient_to_detached
+from sqlalchemy.orm.base import PassiveFlag, LoaderCallableStatus
 from datetime import datetime
 from typing import Optional
 import secrets
@@ -18,8 +20,9 @@ from app.schemas.auth import (
     TokenRefresh
 )
 from app.core.security import (
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
+    failed_login_key,
     create_access_token,
     create_refresh_token,
     verify_token
@@ -31,10 +34,31 @@ from app.core.exceptions import (
     UserAlreadyExistsError
 )
 from app.services.redis import redis_service
+from app.services.login_tracker import last_login_recorder
 from app.core.config import settings
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
-security = HTTPBearer(auto_error=False)
+
+
+class BearerToken(HTTPBearer):
+    """
+    HTTPBearer that yields the raw token string.
+
+    Keeps the OpenAPI security scheme but skips building an
+    HTTPAuthorizationCredentials model on every authenticated request.
+    """
+
+    async def __call__(self, request: Request) -> Optional[str]:
+        authorization = request.headers.get("authorization")
+        if not authorization:
+            return None
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+        return token
+
+
+security = BearerToken(auto_error=False)
 
 # Cookie settings
 REFRESH_TOKEN_COOKIE = "safecon_refresh_token"
@@ -43,9 +67,13 @@ COOKIE_SECURE = not settings.DEBUG  # Use secure cookies in production
 COOKIE_SAMESITE = "lax"  # Allows same-site and top-level navigation
 
 
-def set_auth_cookies(response: Response, refresh_token: str) -> str:
-    """Set authentication cookies and return CSRF token."""
-    csrf_token = secrets.token_urlsafe(32)
+def set_auth_cookies(
+    response: Response,
+    refresh_token: str,
+    csrf_token: Optional[str] = None
+) -> str:
+    """Set authentication cookies and return CSRF token (reused if given)."""
+    csrf_token = csrf_token or secrets.token_urlsafe(32)
 
     # Set refresh token as httpOnly cookie
     response.set_cookie(
@@ -72,45 +100,133 @@ def set_auth_cookies(response: Response, refresh_token: str) -> str:
     return csrf_token
 
 
+def token_payload(user: User) -> dict:
+    """JWT claims identifying a user."""
+    return {
+        "sub": str(user.id),
+        "email": user.email,
+        "auth_level": user.auth_level.value,
+        "tier": user.subscription_tier.value
+    }
+
+
+def create_token_pair(user: User) -> tuple[str, str]:
+    """Create (access_token, refresh_token) sharing one claims payload."""
+    claims = token_payload(user)
+    return create_access_token(claims), create_refresh_token(claims)
+
+
 def clear_auth_cookies(response: Response):
     """Clear authentication cookies."""
     response.delete_cookie(key=REFRESH_TOKEN_COOKIE, path="/")
     response.delete_cookie(key=CSRF_TOKEN_COOKIE, path="/")
 
 
+# Statements built once at import; each request only binds parameters
+SELECT_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+# Relationships (DID, contracts) are not loaded for every request; endpoints
+# query them themselves. Cached users get the same guard in user_from_cache.
+SELECT_CURRENT_USER = (
+    select(User)
+    .options(raiseload("*"))
+    .where(User.id == bindparam("user_id"))
+)
+SELECT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+SELECT_USER_ID_BY_EMAIL = select(User.id).where(User.email == bindparam("email"))
+
+
+# Columns kept in the Redis user cache; the password hash never leaves the DB
+USER_CACHE_COLUMNS = tuple(c for c in User.__table__.columns if c.key != "password_hash")
+
+
+def _encode_columns(instance, columns) -> dict:
+    return {column.key: getattr(instance, column.key) for column in columns}
+
+
+def _decode_columns(model, columns, data: dict):
+    values = {}
+    for column in columns:
+        if column.key not in data:
+            continue
+        value = data[column.key]
+        if value is not None:
+            python_type = column.type.python_type
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type not in (str, bool):
+                value = python_type(value)  # UUID, enums
+        values[column.key] = value
+    return model(**values)
+
+
+def user_to_cache(user: User) -> dict:
+    """Serialize a loaded user for the Redis user cache."""
+    return {"user": _encode_columns(user, USER_CACHE_COLUMNS)}
+
+
+def _raise_on_lazy_load(key: str):
+    """Per-instance loader that refuses to lazy load relationship key."""
+    def load(state, passive):
+        # Flush-time and backref lookups that don't allow SQL just get "not loaded"
+        if not passive & PassiveFlag.SQL_OK:
+            return LoaderCallableStatus.PASSIVE_NO_RESULT
+        raise InvalidRequestError(
+            f"'User.{key}' is not loaded on current_user; query it explicitly"
+        )
+    return load
+
+
+def user_from_cache(db: AsyncSession, payload: dict) -> User:
+    """
+    Rebuild a cached user and attach it to the session without a SELECT.
+
+    The instance is marked as already persisted, so endpoints that
+    modify current_user still flush a normal UPDATE. Relationships raise
+    on access, like SELECT_CURRENT_USER's raiseload, instead of lazy
+    loading (MissingGreenlet under asyncio).
+    """
+    user = _decode_columns(User, USER_CACHE_COLUMNS, payload["user"])
+
+    make_transient_to_detached(user)
+    db.add(user)
+
+    state = inspect(user)
+    for relationship in state.mapper.relationships:
+        state.callables[relationship.key] = _raise_on_lazy_load(relationship.key)
+
+    return user
+
+
 async def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    token: Optional[str] = Depends(security),
     db: AsyncSession = Depends(get_db)
 ) -> User:
     """Get current authenticated user from JWT token (header or cookie)."""
-    token = None
-
-    # Try to get token from Authorization header first
-    if credentials:
-        token = credentials.credentials
-
     if not token:
         raise TokenInvalidError("Authentication required")
 
-    # Check if token is blacklisted
-    if await redis_service.is_token_blacklisted(token):
-        raise TokenInvalidError("Token has been revoked")
-
     token_data = verify_token(token, "access")
 
     if token_data is None:
         raise TokenInvalidError("Invalid or expired token")
 
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.user_did))
-        .where(User.id == token_data.user_id)
-    )
+    # Blacklist check and user cache lookup share one Redis round-trip
+    blacklisted, cached = await redis_service.check_auth(token, token_data.user_id)
+
+    if blacklisted:
+        raise TokenInvalidError("Token has been revoked")
+
+    if cached is not None:
+        return user_from_cache(db, cached)
+
+    result = await db.execute(SELECT_CURRENT_USER, {"user_id": token_data.user_id})
     user = result.scalar_one_or_none()
 
     if user is None:
         raise UserNotFoundError(str(token_data.user_id))
 
+    await redis_service.set_user_cache(user.id, user_to_cache(user), settings.USER_CACHE_TTL_SECONDS)
+
     return user
 
 
@@ -121,21 +237,25 @@ async def register(
 ):
     """Register a new user."""
     # Check if email already exists
-    result = await db.execute(
-        select(User).where(User.email == user_data.email)
-    )
+    result = await db.execute(SELECT_USER_ID_BY_EMAIL, {"email": user_data.email})
     if result.scalar_one_or_none():
         raise UserAlreadyExistsError(user_data.email)
 
-    # Create new user
-    user = User(
-        email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
-        name=user_data.name
+    password_hash = await get_password_hash_async(user_data.password)
+
+    # Create new user; RETURNING loads the defaulted columns in the same round-trip
+    result = await db.execute(
+        insert(User).returning(User),
+        [{
+            "email": user_data.email,
+            "password_hash": password_hash,
+            "name": user_data.name
+        }]
     )
-    db.add(user)
-    await db.flush()
-    await db.refresh(user)
+    user = result.scalar_one()
+
+    # A failed login with these credentials before registering must not block the first login
+    await redis_service.cache_delete(failed_login_key(user_data.email, user_data.password))
 
     return user
 
@@ -147,29 +267,27 @@ async def login(
     db: AsyncSession = Depends(get_db)
 ):
     """Login and get access token. Sets refresh token in httpOnly cookie."""
+    # Repeated bad guesses are rejected before the DB lookup and bcrypt verify
+    bad_password_key = failed_login_key(login_data.email, login_data.password)
+    if await redis_service.cache_get(bad_password_key) is not None:
+        raise InvalidCredentialsError()
+
     # Find user by email
-    result = await db.execute(
-        select(User).where(User.email == login_data.email)
-    )
+    result = await db.execute(SELECT_USER_BY_EMAIL, {"email": login_data.email})
     user = result.scalar_one_or_none()
 
-    if user is None or not verify_password(login_data.password, user.password_hash):
+    if user is None or not await verify_password_async(login_data.password, user.password_hash):
+        await redis_service.cache_set(bad_password_key, "1", settings.FAILED_LOGIN_CACHE_SECONDS)
         raise InvalidCredentialsError()
 
-    # Update last login
-    user.last_login_at = datetime.utcnow()
-    await db.flush()
+    # Update last login (written in batches off the request path)
+    last_login_recorder.record(user.id)
 
-    # Create tokens
-    token_data = {
-        "sub": str(user.id),
-        "email": user.email,
-        "auth_level": user.auth_level.value,
-        "tier": user.subscription_tier.value
-    }
+    # Prime the user cache for the requests that follow a login
+    await redis_service.set_user_cache(user.id, user_to_cache(user), settings.USER_CACHE_TTL_SECONDS)
 
-    access_token = create_access_token(token_data)
-    refresh_token = create_refresh_token(token_data)
+    # Create tokens
+    access_token, refresh_token = create_token_pair(user)
 
     # Set refresh token in httpOnly cookie
     set_auth_cookies(response, refresh_token)
@@ -177,7 +295,7 @@ async def login(
     return AuthResponse(
         access_token=access_token,
         refresh_token=refresh_token,  # Also return for backward compatibility
-        user=UserResponse.model_validate(user)
+        user=UserResponse.from_orm_fast(user)
     )
 
 
@@ -186,6 +304,7 @@ async def refresh_token_endpoint(
     response: Response,
     token_data: Optional[TokenRefresh] = None,
     refresh_token_cookie: Optional[str] = Cookie(None, alias=REFRESH_TOKEN_COOKIE),
+    csrf_token_cookie: Optional[str] = Cookie(None, alias=CSRF_TOKEN_COOKIE),
     db: AsyncSession = Depends(get_db)
 ):
     """Refresh access token using refresh token from cookie or body."""
@@ -202,48 +321,48 @@ async def refresh_token_endpoint(
     if payload is None:
         raise TokenInvalidError("Invalid or expired refresh token")
 
-    # Get user
-    result = await db.execute(
-        select(User).where(User.id == payload.user_id)
-    )
-    user = result.scalar_one_or_none()
+    # Get user; the Redis user cache is invalidated on every user change, so
+    # a hit is current enough to re-issue claims without a SELECT
+    cached = await redis_service.get_user_cache(payload.user_id)
+    if cached is not None:
+        user = _decode_columns(User, USER_CACHE_COLUMNS, cached["user"])
+    else:
+        result = await db.execute(SELECT_USER_BY_ID, {"user_id": payload.user_id})
+        user = result.scalar_one_or_none()
 
-    if user is None:
-        raise UserNotFoundError(str(payload.user_id))
+        if user is None:
+            raise UserNotFoundError(str(payload.user_id))
 
-    # Create new tokens
-    new_token_data = {
-        "sub": str(user.id),
-        "email": user.email,
-        "auth_level": user.auth_level.value,
-        "tier": user.subscription_tier.value
-    }
+        await redis_service.set_user_cache(user.id, user_to_cache(user), settings.USER_CACHE_TTL_SECONDS)
 
-    access_token = create_access_token(new_token_data)
-    new_refresh_token = create_refresh_token(new_token_data)
+    # Create new tokens
+    access_token, new_refresh_token = create_token_pair(user)
 
-    # Set new refresh token in cookie
-    set_auth_cookies(response, new_refresh_token)
+    # Set new refresh token in cookie; the session keeps its CSRF token
+    set_auth_cookies(response, new_refresh_token, csrf_token_cookie)
 
     return AuthResponse(
         access_token=access_token,
         refresh_token=new_refresh_token,
-        user=UserResponse.model_validate(user)
+        user=UserResponse.from_orm_fast(user)
     )
 
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout(
     response: Response,
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
+    token: Optional[str] = Depends(security)
 ):
     """Logout, invalidate access token, and clear cookies."""
     # Blacklist the access token if provided
-    if credentials:
-        token = credentials.credentials
+    if token:
         expires_in = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
         await redis_service.blacklist_token(token, expires_in)
 
+        token_data = verify_token(token, "access")
+        if token_data is not None:
+            await redis_service.invalidate_user_cache(token_data.user_id)
+
     # Clear authentication cookies
     clear_auth_cookies(response)
 
@@ -267,10 +386,18 @@ async def update_me(
     """Update current user profile."""
     update_dict = update_data.model_dump(exclude_unset=True)
 
-    for key, value in update_dict.items():
-        setattr(current_user, key, value)
+    if not update_dict:
+        return UserResponse.from_orm_fast(current_user)
 
-    await db.flush()
-    await db.refresh(current_user)
+    # Single UPDATE ... RETURNING instead of a unit-of-work flush
+    result = await db.execute(
+        update(User)
+        .where(User.id == current_user.id)
+        .values(**update_dict)
+        .returning(User)
+    )
+    user = result.scalar_one()
+    await db.commit()
+    await redis_service.invalidate_user_cache(user.id)
 
-    return current_user
+    return UserResponse.from_orm_fast(user)
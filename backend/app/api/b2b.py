@@ -1,28 +1,46 @@
 """B2B API endpoints for enterprise customers."""
 from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, bindparam, tuple_
 from sqlalchemy.orm import selectinload
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Union
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from collections import defaultdict
 import secrets
 import hashlib
+import hmac
+import time
 
 from app.db.base import get_db
 from app.models.user import User
-from app.models.contract import Contract
+from app.models.contract import Contract, ContractType
 from app.models.subscription import UsageRecord
+from app.models.api_key import ApiKey
 from app.api.auth import get_current_user
+from app.core.config import settings
+from app.utils.lru_cache import LRUCache
+from app.services.usage_tracker import api_usage_recorder, current_period
 
-router = APIRouter(prefix="/b2b", tags=["B2B API"])
+router = APIRouter(prefix="/b2b", tags=["B2B API"], default_response_class=ORJSONResponse)
 
 
-# ==================== In-Memory API Key Storage ====================
-# In production, store in database with proper encryption
+# ==================== API Key Lookup ====================
 
-api_keys: Dict[str, dict] = {}
+# Built once at import; key_hash is a unique B-tree index, so this is a point lookup
+SELECT_API_KEY_BY_HASH = select(ApiKey).where(ApiKey.key_hash == bindparam("key_hash"))
+
+# Verified keys by hash; B2B clients reuse one key for many requests, so most
+# calls skip the DB. Revocation in this process evicts at once, other workers
+# within the TTL.
+verified_api_key_cache = LRUCache(maxsize=10_000, ttl=60)
+
+# Hashes recently found not to exist, so repeated bad keys skip the DB.
+# Keyed by hash rather than the raw header to bound memory per entry.
+unknown_api_key_cache = LRUCache(maxsize=50_000, ttl=30)
 
 
 # ==================== Schemas ====================
@@ -62,6 +80,32 @@ class B2BContractResponse(BaseModel):
     safety_score: Optional[int]
     created_at: datetime
 
+    @classmethod
+    def from_contract(cls, contract) -> "B2BContractResponse":
+        """Build from a loaded Contract row without re-validating trusted columns."""
+        return cls.model_construct(**contract_fields(contract))
+
+
+# Only the columns the B2B responses expose; rows are read as plain tuples
+B2B_CONTRACT_COLUMNS = (
+    Contract.id,
+    Contract.title,
+    Contract.status,
+    Contract.safety_score,
+    Contract.created_at
+)
+
+
+def contract_fields(contract) -> dict:
+    """B2B response fields for a Contract or a B2B_CONTRACT_COLUMNS row."""
+    return {
+        "id": contract.id,
+        "title": contract.title,
+        "status": contract.status.value,
+        "safety_score": contract.safety_score,
+        "created_at": contract.created_at
+    }
+
 
 class B2BAnalysisRequest(BaseModel):
     contract_id: UUID
@@ -92,14 +136,51 @@ class WebhookConfigResponse(BaseModel):
 
 # ==================== Helper Functions ====================
 
+@dataclass(slots=True)
+class VerifiedKey:
+    """An authenticated API key as seen by B2B endpoints."""
+    key_id: UUID
+    user_id: UUID
+    scopes: frozenset
+    expires_at_ts: Optional[float]  # Epoch seconds, compared against time.time()
+
+    @classmethod
+    def from_api_key(cls, key: ApiKey) -> "VerifiedKey":
+        return cls(
+            key_id=key.id,
+            user_id=key.user_id,
+            scopes=frozenset(key.scopes),
+            expires_at_ts=(
+                key.expires_at.replace(tzinfo=timezone.utc).timestamp()
+                if key.expires_at else None
+            )
+        )
+
+    def has_scope(self, required_scope: str) -> bool:
+        """Check if the key grants required_scope (or everything)."""
+        return required_scope in self.scopes or "*" in self.scopes
+
+
+# BLAKE2b takes at most a 64-byte key, so the configured secret is condensed once
+API_KEY_HASH_SECRET = hashlib.sha256(settings.API_KEY_HASH_KEY.encode()).digest()
+
+
 def generate_api_key() -> str:
     """Generate a secure API key."""
     return f"sc_live_{secrets.token_urlsafe(32)}"
 
 
-def hash_api_key(key: str) -> str:
-    """Hash API key for storage."""
-    return hashlib.sha256(key.encode()).hexdigest()
+def hash_api_key(key: Union[str, bytes]) -> str:
+    """
+    Hash API key for storage.
+
+    Keys are 256-bit random tokens, so a keyed BLAKE2b-128 is enough; the
+    server-side key keeps leaked hashes from being checked offline.
+    Accepts the key as bytes so callers holding raw bytes skip an encode.
+    """
+    if isinstance(key, str):
+        key = key.encode()
+    return hashlib.blake2b(key, digest_size=16, key=API_KEY_HASH_SECRET).hexdigest()
 
 
 def get_key_prefix(key: str) -> str:
@@ -110,39 +191,87 @@ def get_key_prefix(key: str) -> str:
 async def verify_api_key(
     x_api_key: str = Header(..., alias="X-API-Key"),
     db: AsyncSession = Depends(get_db)
-) -> dict:
+) -> VerifiedKey:
     """Verify API key and return associated user info."""
     key_hash = hash_api_key(x_api_key)
+    verified = verified_api_key_cache.get(key_hash)
+
+    if verified is None:
+        if key_hash in unknown_api_key_cache:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid API key"
+            )
+        verified = await load_api_key(db, key_hash)
+        verified_api_key_cache.set(key_hash, verified)
+
+    # Checked on every call: a cached entry may outlive the key's expiry
+    if verified.expires_at_ts is not None and time.time() > verified.expires_at_ts:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="API key expired"
+        )
 
-    for key_id, key_data in api_keys.items():
-        if key_data["key_hash"] == key_hash:
-            # Check if expired
-            if key_data["expires_at"] and datetime.utcnow() > key_data["expires_at"]:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="API key expired"
-                )
-
-            if not key_data["is_active"]:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="API key is disabled"
-                )
-
-            # Update last used
-            key_data["last_used_at"] = datetime.utcnow()
-
-            return key_data
-
-    raise HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Invalid API key"
-    )
+    return verified
 
 
-def check_scope(key_data: dict, required_scope: str) -> bool:
-    """Check if API key has required scope."""
-    return required_scope in key_data.get("scopes", []) or "*" in key_data.get("scopes", [])
+async def load_api_key(db: AsyncSession, key_hash: str) -> VerifiedKey:
+    """Look up an API key by hash, raising 401 unless it is usable."""
+    result = await db.execute(SELECT_API_KEY_BY_HASH, {"key_hash": key_hash})
+    key = result.scalar_one_or_none()
+
+    # The index lookup finds the candidate; the stored hash is still confirmed
+    # in constant time so the comparison itself leaks nothing about it
+    if key is None or not hmac.compare_digest(key.key_hash, key_hash):
+        unknown_api_key_cache.set(key_hash, True)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key"
+        )
+
+    if not key.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="API key is disabled"
+        )
+
+    # Update last used (flushed with the request's commit); cache hits skip
+    # this, so the timestamp is accurate to the cache TTL
+    key.last_used_at = datetime.utcnow()
+
+    return VerifiedKey.from_api_key(key)
+
+
+def api_key_response_fields(key: ApiKey) -> dict:
+    """Fields shared by the API key response schemas."""
+    return {
+        "id": str(key.id),
+        "name": key.name,
+        "key_prefix": key.key_prefix,
+        "scopes": key.scopes,
+        "created_at": key.created_at,
+        "expires_at": key.expires_at,
+        "last_used_at": key.last_used_at,
+        "is_active": key.is_active
+    }
+
+
+def encode_contract_cursor(contract) -> str:
+    """Opaque keyset cursor pointing just past a contract in the newest-first listing."""
+    return f"{contract.created_at.isoformat()}_{contract.id}"
+
+
+def decode_contract_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Parse a cursor from encode_contract_cursor, raising 400 if malformed."""
+    created_at, _, contract_id = cursor.rpartition("_")
+    try:
+        return datetime.fromisoformat(created_at), UUID(contract_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
 
 
 # ==================== API Key Management ====================
@@ -163,83 +292,71 @@ async def create_api_key(
 
     # Generate key
     api_key = generate_api_key()
-    key_hash = hash_api_key(api_key)
-    key_id = secrets.token_hex(8)
 
     # Calculate expiry
     expires_at = None
     if request.expires_in_days:
         expires_at = datetime.utcnow() + timedelta(days=request.expires_in_days)
 
-    # Store key
-    key_data = {
-        "id": key_id,
-        "name": request.name,
-        "key_hash": key_hash,
-        "key_prefix": get_key_prefix(api_key),
-        "user_id": str(current_user.id),
-        "scopes": request.scopes,
-        "created_at": datetime.utcnow(),
-        "expires_at": expires_at,
-        "last_used_at": None,
-        "is_active": True
-    }
-    api_keys[key_id] = key_data
+    # Store key; only its hash is persisted
+    result = await db.execute(
+        insert(ApiKey).returning(ApiKey),
+        [{
+            "user_id": current_user.id,
+            "name": request.name,
+            "key_hash": hash_api_key(api_key),
+            "key_prefix": get_key_prefix(api_key),
+            "scopes": request.scopes,
+            "expires_at": expires_at
+        }]
+    )
+    key = result.scalar_one()
 
     return APIKeyCreateResponse(
-        id=key_id,
-        name=request.name,
-        key_prefix=get_key_prefix(api_key),
-        scopes=request.scopes,
-        created_at=key_data["created_at"],
-        expires_at=expires_at,
-        last_used_at=None,
-        is_active=True,
+        **api_key_response_fields(key),
         api_key=api_key  # Only shown once!
     )
 
 
 @router.get("/keys", response_model=List[APIKeyResponse])
 async def list_api_keys(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """List all API keys for the current user."""
-    user_keys = [
-        APIKeyResponse(
-            id=k["id"],
-            name=k["name"],
-            key_prefix=k["key_prefix"],
-            scopes=k["scopes"],
-            created_at=k["created_at"],
-            expires_at=k["expires_at"],
-            last_used_at=k["last_used_at"],
-            is_active=k["is_active"]
-        )
-        for k in api_keys.values()
-        if k["user_id"] == str(current_user.id)
-    ]
-    return user_keys
+    result = await db.execute(
+        select(ApiKey)
+        .where(ApiKey.user_id == current_user.id)
+        .order_by(ApiKey.created_at)
+    )
+    # Rows are trusted, so build responses without re-validating each field
+    return [APIKeyResponse.model_construct(**api_key_response_fields(k)) for k in result.scalars()]
 
 
 @router.delete("/keys/{key_id}")
 async def revoke_api_key(
-    key_id: str,
-    current_user: User = Depends(get_current_user)
+    key_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Revoke an API key."""
-    if key_id not in api_keys:
+    result = await db.execute(select(ApiKey).where(ApiKey.id == key_id))
+    key = result.scalar_one_or_none()
+
+    if key is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="API key not found"
         )
 
-    if api_keys[key_id]["user_id"] != str(current_user.id):
+    if key.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Cannot revoke another user's API key"
         )
 
-    del api_keys[key_id]
+    await db.delete(key)
+    verified_api_key_cache.delete(key.key_hash)
     return {"message": "API key revoked"}
 
 
@@ -248,18 +365,16 @@ async def revoke_api_key(
 @router.post("/contracts", response_model=B2BContractResponse)
 async def create_contract_b2b(
     request: B2BContractRequest,
-    key_data: dict = Depends(verify_api_key),
+    verified: VerifiedKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db)
 ):
     """Create a contract via API."""
-    if not check_scope(key_data, "contracts:write"):
+    if not verified.has_scope("contracts:write"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient scope: contracts:write required"
         )
 
-    from app.models.contract import Contract, ContractType
-
     # Map contract type
     try:
         contract_type = ContractType(request.contract_type)
@@ -267,7 +382,7 @@ async def create_contract_b2b(
         contract_type = ContractType.OTHER
 
     contract = Contract(
-        user_id=UUID(key_data["user_id"]),
+        user_id=verified.user_id,
         title=request.title,
         description=request.content[:500] if request.content else None,
         contract_type=contract_type
@@ -277,74 +392,77 @@ async def create_contract_b2b(
     await db.flush()
 
     # Track API usage
-    await track_api_usage(db, UUID(key_data["user_id"]))
-
-    return B2BContractResponse(
-        id=contract.id,
-        title=contract.title,
-        status=contract.status.value,
-        safety_score=contract.safety_score,
-        created_at=contract.created_at
-    )
+    api_usage_recorder.record(verified.user_id)
+
+    return B2BContractResponse.from_contract(contract)
 
 
 @router.get("/contracts", response_model=List[B2BContractResponse])
 async def list_contracts_b2b(
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 50,
-    key_data: dict = Depends(verify_api_key),
+    verified: VerifiedKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db)
 ):
-    """List contracts via API."""
-    if not check_scope(key_data, "contracts:read"):
+    """
+    List contracts via API, newest first.
+
+    When a full page is returned, the X-Next-Cursor header holds the cursor
+    for the next page. Paging by cursor costs the same at any depth; skip
+    is kept for existing clients and ignored when a cursor is given.
+    """
+    if not verified.has_scope("contracts:read"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient scope: contracts:read required"
         )
 
-    result = await db.execute(
-        select(Contract)
-        .where(Contract.user_id == UUID(key_data["user_id"]))
-        .order_by(Contract.created_at.desc())
-        .offset(skip)
-        .limit(min(limit, 100))
+    limit = min(limit, 100)
+    query = (
+        select(*B2B_CONTRACT_COLUMNS)
+        .where(Contract.user_id == verified.user_id)
+        .order_by(Contract.created_at.desc(), Contract.id.desc())
+        .limit(limit)
     )
-    contracts = result.scalars().all()
+    if cursor:
+        query = query.where(
+            tuple_(Contract.created_at, Contract.id) < tuple_(*decode_contract_cursor(cursor))
+        )
+    elif skip:
+        query = query.offset(skip)
 
-    await track_api_usage(db, UUID(key_data["user_id"]))
+    result = await db.execute(query)
+    contracts = result.all()
 
-    return [
-        B2BContractResponse(
-            id=c.id,
-            title=c.title,
-            status=c.status.value,
-            safety_score=c.safety_score,
-            created_at=c.created_at
-        )
-        for c in contracts
-    ]
+    api_usage_recorder.record(verified.user_id)
+
+    # Rows are trusted, so serialize plain dicts directly; response_model
+    # still documents the shape in OpenAPI
+    headers = {"X-Next-Cursor": encode_contract_cursor(contracts[-1])} if contracts and len(contracts) == limit else None
+    return ORJSONResponse([contract_fields(c) for c in contracts], headers=headers)
 
 
 @router.get("/contracts/{contract_id}", response_model=B2BContractResponse)
 async def get_contract_b2b(
     contract_id: UUID,
-    key_data: dict = Depends(verify_api_key),
+    verified: VerifiedKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific contract via API."""
-    if not check_scope(key_data, "contracts:read"):
+    if not verified.has_scope("contracts:read"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient scope: contracts:read required"
         )
 
     result = await db.execute(
-        select(Contract).where(
+        select(*B2B_CONTRACT_COLUMNS).where(
             Contract.id == contract_id,
-            Contract.user_id == UUID(key_data["user_id"])
+            Contract.user_id == verified.user_id
         )
     )
-    contract = result.scalar_one_or_none()
+    contract = result.one_or_none()
 
     if not contract:
         raise HTTPException(
@@ -352,25 +470,19 @@ async def get_contract_b2b(
             detail="Contract not found"
         )
 
-    await track_api_usage(db, UUID(key_data["user_id"]))
+    api_usage_recorder.record(verified.user_id)
 
-    return B2BContractResponse(
-        id=contract.id,
-        title=contract.title,
-        status=contract.status.value,
-        safety_score=contract.safety_score,
-        created_at=contract.created_at
-    )
+    return B2BContractResponse.from_contract(contract)
 
 
 @router.post("/analyze", response_model=B2BAnalysisResponse)
 async def analyze_contract_b2b(
     request: B2BAnalysisRequest,
-    key_data: dict = Depends(verify_api_key),
+    verified: VerifiedKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db)
 ):
     """Analyze a contract via API."""
-    if not check_scope(key_data, "analysis:read"):
+    if not verified.has_scope("analysis:read"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient scope: analysis:read required"
@@ -380,7 +492,7 @@ async def analyze_contract_b2b(
     result = await db.execute(
         select(Contract).where(
             Contract.id == request.contract_id,
-            Contract.user_id == UUID(key_data["user_id"])
+            Contract.user_id == verified.user_id
         )
     )
     contract = result.scalar_one_or_none()
@@ -409,7 +521,7 @@ async def analyze_contract_b2b(
         ]
     }
 
-    await track_api_usage(db, UUID(key_data["user_id"]))
+    api_usage_recorder.record(verified.user_id)
 
     return B2BAnalysisResponse(
         contract_id=contract.id,
@@ -423,33 +535,32 @@ async def analyze_contract_b2b(
 
 @router.get("/usage")
 async def get_api_usage(
-    key_data: dict = Depends(verify_api_key),
+    verified: VerifiedKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db)
 ):
     """Get API usage statistics."""
-    now = datetime.utcnow()
-    period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    period = current_period()
 
     result = await db.execute(
         select(UsageRecord).where(
-            UsageRecord.user_id == UUID(key_data["user_id"]),
-            UsageRecord.period_start == period_start
+            UsageRecord.user_id == verified.user_id,
+            UsageRecord.period_start == period.start
         )
     )
     usage = result.scalar_one_or_none()
 
     if not usage:
         return {
-            "period_start": period_start.isoformat(),
-            "period_end": (period_start.replace(month=period_start.month + 1) if period_start.month < 12 else period_start.replace(year=period_start.year + 1, month=1)).isoformat(),
+            "period_start": period.start_iso,
+            "period_end": period.end_iso,
             "api_calls": 0,
             "contracts_created": 0,
             "analyses_performed": 0
         }
 
     return {
-        "period_start": usage.period_start.isoformat(),
-        "period_end": usage.period_end.isoformat(),
+        "period_start": period.start_iso,
+        "period_end": period.end_iso,
         "api_calls": usage.api_calls,
         "contracts_created": usage.contracts_created,
         "analyses_performed": usage.analyses_performed
@@ -459,6 +570,7 @@ async def get_api_usage(
 # ==================== Webhooks ====================
 
 webhooks: Dict[str, dict] = {}
+webhooks_by_user: Dict[UUID, Dict[str, dict]] = defaultdict(dict)  # user_id -> {webhook_id: data}
 
 
 @router.post("/webhooks", response_model=WebhookConfigResponse)
@@ -471,7 +583,7 @@ async def create_webhook(
 
     webhook_data = {
         "id": webhook_id,
-        "user_id": str(current_user.id),
+        "user_id": current_user.id,
         "url": request.url,
         "events": request.events,
         "secret": request.secret or secrets.token_hex(16),
@@ -479,6 +591,7 @@ async def create_webhook(
         "created_at": datetime.utcnow()
     }
     webhooks[webhook_id] = webhook_data
+    webhooks_by_user[webhook_data["user_id"]][webhook_id] = webhook_data
 
     return WebhookConfigResponse(
         id=webhook_id,
@@ -495,15 +608,14 @@ async def list_webhooks(
 ):
     """List configured webhooks."""
     user_webhooks = [
-        WebhookConfigResponse(
+        WebhookConfigResponse.model_construct(
             id=w["id"],
             url=w["url"],
             events=w["events"],
             is_active=w["is_active"],
             created_at=w["created_at"]
         )
-        for w in webhooks.values()
-        if w["user_id"] == str(current_user.id)
+        for w in webhooks_by_user.get(current_user.id, {}).values()
     ]
     return user_webhooks
 
@@ -520,43 +632,12 @@ async def delete_webhook(
             detail="Webhook not found"
         )
 
-    if webhooks[webhook_id]["user_id"] != str(current_user.id):
+    if webhooks[webhook_id]["user_id"] != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Cannot delete another user's webhook"
         )
 
-    del webhooks[webhook_id]
+    webhook_data = webhooks.pop(webhook_id)
+    webhooks_by_user[webhook_data["user_id"]].pop(webhook_id, None)
     return {"message": "Webhook deleted"}
-
-
-# ==================== Helper Functions ====================
-
-async def track_api_usage(db: AsyncSession, user_id: UUID):
-    """Track API call in usage records."""
-    now = datetime.utcnow()
-    period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-    result = await db.execute(
-        select(UsageRecord).where(
-            UsageRecord.user_id == user_id,
-            UsageRecord.period_start == period_start
-        )
-    )
-    usage = result.scalar_one_or_none()
-
-    if not usage:
-        if now.month == 12:
-            period_end = period_start.replace(year=now.year + 1, month=1)
-        else:
-            period_end = period_start.replace(month=now.month + 1)
-
-        usage = UsageRecord(
-            user_id=user_id,
-            period_start=period_start,
-            period_end=period_end
-        )
-        db.add(usage)
-
-    usage.api_calls += 1
-    await db.flush()
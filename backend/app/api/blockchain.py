@@ -1,8 +1,8 @@
 """Blockchain anchoring API endpoints for content proof."""
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from fastapi.responses import Response
+from fastapi.responses import Response, RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, func, bindparam
 from sqlalchemy.orm import selectinload
 from pydantic import BaseModel
 from typing import Optional, List
@@ -15,11 +15,13 @@ import json
 from app.db.base import get_db
 from app.models.user import User
 from app.models.contract import Contract, ContractDocument
-from app.models.blockchain import BlockchainRecord, Certificate, AnchorStatus
+from app.models.blockchain import BlockchainRecord, Certificate, AnchorStatus, certificate_number_seq
 from app.api.auth import get_current_user
 from app.services.did_baas import get_did_baas_client, DidBaasClient, DidBaasError
 from app.services.certificate import get_certificate_service
+from app.services.storage import storage_service, StorageError
 from app.core.config import settings
+from app.utils.lru_cache import LRUCache
 
 router = APIRouter(prefix="/blockchain", tags=["Blockchain Anchoring"])
 
@@ -101,73 +103,192 @@ class BatchAnchorResponse(BaseModel):
 
 # ==================== Helper Functions ====================
 
-def compute_merkle_root(hashes: List[str]) -> tuple[str, List[List[str]]]:
+def _pad_level(level: List[bytes]) -> List[bytes]:
+    """Duplicate the last node of an odd-sized level."""
+    return level + [level[-1]] if len(level) % 2 == 1 else level
+
+
+def _parent_level(level: List[bytes]) -> List[bytes]:
+    """Hash adjacent pairs of an even-sized level."""
+    # Join the level once and hash 64-byte views of it: no per-pair
+    # concatenation. hashlib dispatches to OpenSSL, which already uses
+    # SHA-NI/ARMv8 SHA2 when present
+    joined = memoryview(b"".join(level))
+    sha256 = hashlib.sha256
+    return [sha256(joined[i:i + 64]).digest() for i in range(0, len(joined), 64)]
+
+
+def merkle_root(hashes: List[bytes]) -> bytes:
     """
-    Compute Merkle root from list of hashes.
-    Returns (root, proof_tree).
+    Merkle root of raw 32-byte digests, keeping only the current level.
+    Convert to hex only at the API boundary.
     """
     if not hashes:
-        return "", []
+        return b""
 
-    # Ensure even number of leaves
-    if len(hashes) % 2 == 1:
-        hashes = hashes + [hashes[-1]]
+    level = _pad_level(hashes)
+    while len(level) > 1:
+        level = _parent_level(level)
+        if len(level) > 1:
+            level = _pad_level(level)
 
-    tree = [hashes]
+    return level[0]
 
-    while len(hashes) > 1:
-        next_level = []
-        for i in range(0, len(hashes), 2):
-            combined = hashes[i] + hashes[i + 1]
-            next_hash = hashlib.sha256(combined.encode()).hexdigest()
-            next_level.append(next_hash)
 
-        if len(next_level) > 1 and len(next_level) % 2 == 1:
-            next_level = next_level + [next_level[-1]]
+def merkle_root_with_proofs(hashes: List[bytes]) -> tuple[bytes, List[List[dict]]]:
+    """
+    Merkle root plus the proof (hex sibling hashes) for every leaf.
 
-        tree.append(next_level)
-        hashes = next_level
+    Proofs are extended level by level during the same bottom-up sweep, so
+    only the current level is held rather than the whole tree. Leaf i's
+    node at depth d is i >> d and its sibling is that index ^ 1.
+    """
+    if not hashes:
+        return b"", []
 
-    return hashes[0], tree
+    proofs: List[List[dict]] = [[] for _ in hashes]
+    level = _pad_level(hashes)
+    depth = 0
 
+    while len(level) > 1:
+        # Each node is hex-encoded once and shared by every proof using it
+        hex_level = [node.hex() for node in level]
+        for leaf, proof in enumerate(proofs):
+            index = leaf >> depth
+            proof.append({
+                "hash": hex_level[index ^ 1],
+                "position": "left" if index & 1 else "right"
+            })
 
-def get_merkle_proof(hash_value: str, tree: List[List[str]]) -> List[dict]:
-    """Get Merkle proof for a specific hash."""
-    proof = []
+        level = _parent_level(level)
+        if len(level) > 1:
+            level = _pad_level(level)
+        depth += 1
 
-    if not tree or hash_value not in tree[0]:
-        return []
+    return level[0], proofs
 
-    index = tree[0].index(hash_value)
 
-    for level in tree[:-1]:  # Exclude root
-        if index % 2 == 0:
-            sibling_index = index + 1
-            position = "right"
-        else:
-            sibling_index = index - 1
-            position = "left"
+def parse_document_hashes(hashes: List[str]) -> List[bytes]:
+    """Decode hex SHA-256 document hashes once, raising 400 on malformed input."""
+    try:
+        digests = [bytes.fromhex(h) for h in hashes]
+    except ValueError:
+        digests = None
+
+    if digests is None or any(len(d) != 32 for d in digests):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Document hashes must be hex-encoded SHA-256 digests"
+        )
+
+    return digests
 
-        if sibling_index < len(level):
-            proof.append({
-                "hash": level[sibling_index],
-                "position": position
-            })
 
-        index = index // 2
+# Confirmed anchors never change, so positive verifications are served from
+# memory. Misses are not cached so newly confirmed hashes show up at once.
+verified_document_cache = LRUCache(maxsize=100_000, ttl=600)
 
-    return proof
+
+# Anchor and certificate counts for a user in one round-trip. Certificates
+# are one-to-one with records, so the outer join never double-counts.
+SELECT_BLOCKCHAIN_STATS = (
+    select(
+        func.count(BlockchainRecord.id),
+        func.count(BlockchainRecord.id).filter(BlockchainRecord.status == AnchorStatus.CONFIRMED),
+        func.count(BlockchainRecord.id).filter(BlockchainRecord.status == AnchorStatus.PENDING),
+        func.count(Certificate.id)
+    )
+    .select_from(BlockchainRecord)
+    .outerjoin(Certificate, Certificate.blockchain_record_id == BlockchainRecord.id)
+    .where(
+        BlockchainRecord.contract_id.in_(
+            select(Contract.id).where(Contract.user_id == bindparam("user_id"))
+        )
+    )
+)
+
+
+# Live anchor for a contract/hash pair, limited to the AnchorResponse
+# columns: rows come back as plain tuples, skipping salt, merkle_proof and
+# the identity map on the (common) new-anchor path
+SELECT_EXISTING_ANCHOR = (
+    select(
+        BlockchainRecord.id,
+        BlockchainRecord.contract_id,
+        BlockchainRecord.document_hash,
+        BlockchainRecord.status,
+        BlockchainRecord.tx_hash,
+        BlockchainRecord.block_number,
+        BlockchainRecord.network,
+        BlockchainRecord.created_at,
+        BlockchainRecord.confirmed_at
+    )
+    .where(
+        BlockchainRecord.contract_id == bindparam("contract_id"),
+        BlockchainRecord.document_hash == bindparam("document_hash"),
+        BlockchainRecord.status.in_([AnchorStatus.PENDING, AnchorStatus.CONFIRMED])
+    )
+    .limit(1)
+)
 
 
 async def generate_certificate_number(db: AsyncSession) -> str:
     """Generate unique certificate number."""
     year = datetime.utcnow().year
+    serial = await db.scalar(select(certificate_number_seq.next_value()))
+    return f"SC-{year}-{serial:06d}"
+
+
+async def ensure_certificate(db: AsyncSession, anchor_id: UUID, user: User) -> BlockchainRecord:
+    """
+    Load a confirmed anchor the user may access, issuing its certificate if missing.
+
+    Returns the record with contract and certificate loaded.
+    """
     result = await db.execute(
-        select(func.count(Certificate.id))
-        .where(Certificate.certificate_number.like(f"SC-{year}-%"))
+        select(BlockchainRecord)
+        .options(
+            selectinload(BlockchainRecord.contract),
+            selectinload(BlockchainRecord.certificate)
+        )
+        .where(BlockchainRecord.id == anchor_id)
     )
-    count = result.scalar() or 0
-    return f"SC-{year}-{count + 1:06d}"
+    record = result.scalar_one_or_none()
+
+    if not record:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Anchor record not found"
+        )
+
+    if record.status != AnchorStatus.CONFIRMED:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Certificate only available for confirmed anchors"
+        )
+
+    # Authorization check
+    if record.contract and record.contract.user_id != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not authorized to access this certificate"
+        )
+
+    # Generate certificate if not exists
+    if not record.certificate:
+        cert_number = await generate_certificate_number(db)
+        verification_url = f"https://trendy.storydot.kr/law/verify/{record.id}"
+
+        certificate = Certificate(
+            blockchain_record_id=record.id,
+            certificate_number=cert_number,
+            verification_url=verification_url
+        )
+        db.add(certificate)
+        await db.flush()
+        record.certificate = certificate
+
+    return record
 
 
 # ==================== Endpoints ====================
@@ -206,13 +327,10 @@ async def anchor_document(
 
     # Check for existing anchor with same hash
     result = await db.execute(
-        select(BlockchainRecord).where(
-            BlockchainRecord.contract_id == request.contract_id,
-            BlockchainRecord.document_hash == request.document_hash,
-            BlockchainRecord.status.in_([AnchorStatus.PENDING, AnchorStatus.CONFIRMED])
-        )
+        SELECT_EXISTING_ANCHOR,
+        {"contract_id": request.contract_id, "document_hash": request.document_hash}
     )
-    existing = result.scalar_one_or_none()
+    existing = result.first()
 
     if existing:
         return AnchorResponse(
@@ -227,18 +345,18 @@ async def anchor_document(
             confirmed_at=existing.confirmed_at
         )
 
-    # Generate salt for privacy
-    salt = secrets.token_hex(32)
-    salted_hash = hashlib.sha256(
-        (request.document_hash + salt).encode()
-    ).hexdigest()
+    # Generate salt for privacy; hashing raw digest + salt is a single
+    # 64-byte SHA-256 input instead of 128 bytes of hex text
+    digest = parse_document_hashes([request.document_hash])[0]
+    salt = secrets.token_bytes(32)
+    salted_hash = hashlib.sha256(digest + salt).hexdigest()
 
     # Create blockchain record
     record = BlockchainRecord(
         contract_id=request.contract_id,
         document_id=request.document_id,
         document_hash=request.document_hash,
-        salt=salt,
+        salt=salt.hex(),
         network="xphere",
         status=AnchorStatus.PENDING
     )
@@ -314,7 +432,7 @@ async def get_anchor_status(
         block_number=record.block_number,
         confirmations=confirmations,
         network=record.network,
-        merkle_root=record.merkle_root,
+        merkle_root=record.merkle_root.hex() if record.merkle_root else None,
         merkle_proof=record.merkle_proof
     )
 
@@ -329,6 +447,10 @@ async def verify_document(
 
     This is a public endpoint - no authentication required.
     """
+    cached = verified_document_cache.get(request.document_hash)
+    if cached is not None:
+        return cached
+
     # Search for matching anchor
     result = await db.execute(
         select(BlockchainRecord).where(
@@ -350,7 +472,7 @@ async def verify_document(
             message="Document hash not found in blockchain records"
         )
 
-    return VerifyResponse(
+    response = VerifyResponse(
         verified=True,
         document_hash=request.document_hash,
         anchor_id=record.id,
@@ -360,6 +482,9 @@ async def verify_document(
         network=record.network,
         message="Document verified on Xphere blockchain"
     )
+    verified_document_cache.set(request.document_hash, response)
+
+    return response
 
 
 @router.post("/batch-anchor", response_model=BatchAnchorResponse)
@@ -375,38 +500,43 @@ async def batch_anchor_documents(
     This is more efficient for anchoring multiple documents
     as only one blockchain transaction is needed.
     """
-    if len(request.hashes) < 2:
+    # Repeated hashes would only add leaves and records; order is kept
+    hashes = list(dict.fromkeys(request.hashes))
+
+    if len(hashes) < 2:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Batch anchor requires at least 2 hashes"
         )
 
-    if len(request.hashes) > 100:
+    if len(hashes) > 100:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Maximum 100 hashes per batch"
         )
 
-    # Compute Merkle root
-    merkle_root, tree = compute_merkle_root(request.hashes)
+    # Compute Merkle root over raw digests
+    digests = parse_document_hashes(hashes)
+    root, proofs = merkle_root_with_proofs(digests)
+    merkle_root = root.hex()  # For the response and the chain submission
     batch_id = f"BATCH-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{secrets.token_hex(4)}"
 
-    # Create records for each hash
-    for doc_hash in request.hashes:
-        proof = get_merkle_proof(doc_hash, tree)
-
-        record = BlockchainRecord(
-            contract_id=None,  # Batch doesn't have single contract
-            document_hash=doc_hash,
-            merkle_root=merkle_root,
-            merkle_proof=proof,
-            batch_id=batch_id,
-            network="xphere",
-            status=AnchorStatus.QUEUED
-        )
-        db.add(record)
-
-    await db.flush()
+    # Create records for each hash in one multi-row INSERT; proofs are in hash order
+    await db.execute(
+        insert(BlockchainRecord),
+        [
+            {
+                "contract_id": None,  # Batch doesn't have single contract
+                "document_hash": doc_hash,
+                "merkle_root": root,
+                "merkle_proof": proof,
+                "batch_id": batch_id,
+                "network": "xphere",
+                "status": AnchorStatus.QUEUED
+            }
+            for doc_hash, proof in zip(hashes, proofs)
+        ]
+    )
 
     # Queue batch for anchoring
     background_tasks.add_task(
@@ -418,7 +548,7 @@ async def batch_anchor_documents(
     return BatchAnchorResponse(
         batch_id=batch_id,
         merkle_root=merkle_root,
-        total_documents=len(request.hashes),
+        total_documents=len(hashes),
         status="queued",
         tx_hash=None
     )
@@ -433,52 +563,23 @@ async def process_batch_anchor(batch_id: str, merkle_root: str):
 @router.get("/certificate/{anchor_id}", response_model=CertificateResponse)
 async def get_certificate(
     anchor_id: UUID,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get or generate certificate for a confirmed anchor."""
-    result = await db.execute(
-        select(BlockchainRecord)
-        .options(
-            selectinload(BlockchainRecord.contract),
-            selectinload(BlockchainRecord.certificate)
-        )
-        .where(BlockchainRecord.id == anchor_id)
-    )
-    record = result.scalar_one_or_none()
-
-    if not record:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Anchor record not found"
-        )
-
-    if record.status != AnchorStatus.CONFIRMED:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Certificate only available for confirmed anchors"
-        )
+    record = await ensure_certificate(db, anchor_id, current_user)
 
-    # Authorization check
-    if record.contract and record.contract.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not authorized to access this certificate"
-        )
-
-    # Generate certificate if not exists
-    if not record.certificate:
-        cert_number = await generate_certificate_number(db)
-        verification_url = f"https://trendy.storydot.kr/law/verify/{record.id}"
-
-        certificate = Certificate(
-            blockchain_record_id=record.id,
-            certificate_number=cert_number,
-            verification_url=verification_url
-        )
-        db.add(certificate)
-        await db.flush()
-        record.certificate = certificate
+    # pdf_url holds the storage path; until it is set the client shows
+    # "generating" and polls, while the PDF renders after this response.
+    # Without a PDF backend there is nothing to queue; downloads fall back
+    # to HTML.
+    pdf_url = None
+    cert_service = get_certificate_service()
+    if record.certificate.pdf_url:
+        pdf_url = await storage_service.get_file_url(record.certificate.pdf_url)
+    elif cert_service.can_queue_pdf(record.id):
+        background_tasks.add_task(cert_service.generate_and_store_pdf, record.id)
 
     return CertificateResponse(
         id=record.certificate.id,
@@ -488,7 +589,7 @@ async def get_certificate(
         tx_hash=record.tx_hash,
         block_number=record.block_number,
         network=record.network,
-        pdf_url=record.certificate.pdf_url,
+        pdf_url=pdf_url,
         qr_code_url=record.certificate.qr_code_url,
         verification_url=record.certificate.verification_url,
         created_at=record.certificate.created_at
@@ -498,94 +599,59 @@ async def get_certificate(
 @router.get("/certificate/{anchor_id}/pdf")
 async def download_certificate_pdf(
     anchor_id: UUID,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Download certificate as PDF."""
-    result = await db.execute(
-        select(BlockchainRecord)
-        .options(
-            selectinload(BlockchainRecord.contract),
-            selectinload(BlockchainRecord.certificate)
-        )
-        .where(BlockchainRecord.id == anchor_id)
-    )
-    record = result.scalar_one_or_none()
-
-    if not record:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Anchor record not found"
-        )
-
-    if record.status != AnchorStatus.CONFIRMED:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Certificate only available for confirmed anchors"
-        )
-
-    # Authorization check
-    if record.contract and record.contract.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not authorized to access this certificate"
-        )
-
-    # Generate certificate if not exists
-    if not record.certificate:
-        cert_number = await generate_certificate_number(db)
-        verification_url = f"https://trendy.storydot.kr/law/verify/{record.id}"
-
-        certificate = Certificate(
-            blockchain_record_id=record.id,
-            certificate_number=cert_number,
-            verification_url=verification_url
-        )
-        db.add(certificate)
-        await db.flush()
-        record.certificate = certificate
+    record = await ensure_certificate(db, anchor_id, current_user)
+    certificate = record.certificate
+    filename = f"SafeCon_Certificate_{certificate.certificate_number}"
+
+    # Already rendered: hand out the stored file instead of rendering again
+    if certificate.pdf_url:
+        try:
+            if storage_service.is_s3:
+                return RedirectResponse(
+                    await storage_service.get_file_url(certificate.pdf_url),
+                    status_code=status.HTTP_302_FOUND
+                )
+            return Response(
+                content=await storage_service.download_file(certificate.pdf_url),
+                media_type="application/pdf",
+                headers={"Content-Disposition": f"attachment; filename={filename}.pdf"}
+            )
+        except StorageError:
+            pass  # Stored file is gone; render it again below
 
     # Generate PDF
     cert_service = get_certificate_service()
-    contract_title = record.contract.title if record.contract else "Untitled Contract"
+    fields = cert_service.record_fields(record)
 
-    pdf_bytes = await cert_service.generate_certificate_pdf(
-        certificate_number=record.certificate.certificate_number,
-        contract_title=contract_title,
-        document_hash=record.document_hash,
-        tx_hash=record.tx_hash or "pending",
-        block_number=record.block_number or 0,
-        network=record.network,
-        anchored_at=record.confirmed_at or datetime.utcnow(),
-        verification_url=record.certificate.verification_url,
-    )
+    pdf_bytes = await cert_service.generate_certificate_pdf(**fields)
 
     if pdf_bytes:
+        # Keep it for the next download without delaying this one
+        background_tasks.add_task(
+            cert_service.store_pdf,
+            certificate.id,
+            certificate.certificate_number,
+            pdf_bytes
+        )
         return Response(
             content=pdf_bytes,
             media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=SafeCon_Certificate_{record.certificate.certificate_number}.pdf"
-            }
+            headers={"Content-Disposition": f"attachment; filename={filename}.pdf"}
         )
 
     # Fallback: Return HTML for printing
-    html = cert_service.generate_certificate_html(
-        certificate_number=record.certificate.certificate_number,
-        contract_title=contract_title,
-        document_hash=record.document_hash,
-        tx_hash=record.tx_hash or "pending",
-        block_number=record.block_number or 0,
-        network=record.network,
-        anchored_at=record.confirmed_at or datetime.utcnow(),
-        verification_url=record.certificate.verification_url,
-    )
+    html = cert_service.generate_certificate_html(**fields)
 
     return Response(
         content=html,
         media_type="text/html",
         headers={
-            "Content-Disposition": f"inline; filename=SafeCon_Certificate_{record.certificate.certificate_number}.html"
+            "Content-Disposition": f"inline; filename={filename}.html"
         }
     )
 
@@ -645,52 +711,8 @@ async def get_blockchain_stats(
     db: AsyncSession = Depends(get_db)
 ):
     """Get user's blockchain anchoring statistics."""
-    # Get user's contracts
-    result = await db.execute(
-        select(Contract.id).where(Contract.user_id == current_user.id)
-    )
-    contract_ids = [r[0] for r in result.all()]
-
-    if not contract_ids:
-        return {
-            "total_anchors": 0,
-            "confirmed_anchors": 0,
-            "pending_anchors": 0,
-            "total_certificates": 0
-        }
-
-    # Count anchors
-    result = await db.execute(
-        select(func.count(BlockchainRecord.id))
-        .where(BlockchainRecord.contract_id.in_(contract_ids))
-    )
-    total = result.scalar() or 0
-
-    result = await db.execute(
-        select(func.count(BlockchainRecord.id))
-        .where(
-            BlockchainRecord.contract_id.in_(contract_ids),
-            BlockchainRecord.status == AnchorStatus.CONFIRMED
-        )
-    )
-    confirmed = result.scalar() or 0
-
-    result = await db.execute(
-        select(func.count(BlockchainRecord.id))
-        .where(
-            BlockchainRecord.contract_id.in_(contract_ids),
-            BlockchainRecord.status == AnchorStatus.PENDING
-        )
-    )
-    pending = result.scalar() or 0
-
-    # Count certificates
-    result = await db.execute(
-        select(func.count(Certificate.id))
-        .join(BlockchainRecord)
-        .where(BlockchainRecord.contract_id.in_(contract_ids))
-    )
-    certificates = result.scalar() or 0
+    result = await db.execute(SELECT_BLOCKCHAIN_STATS, {"user_id": current_user.id})
+    total, confirmed, pending, certificates = result.one()
 
     return {
         "total_anchors": total,
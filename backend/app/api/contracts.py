@@ -2,8 +2,9 @@ from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
+import asyncio
 import hashlib
 import os
 import aiofiles
@@ -21,10 +22,26 @@ from app.schemas.contract import (
 )
 from app.api.auth import get_current_user
 from app.core.config import settings
-from app.core.file_validator import validate_uploaded_file
+from app.core.file_validator import validate_file_header
 
 router = APIRouter(prefix="/contracts", tags=["Contracts"])
 
+# Uploads are read, hashed and written in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Encodings tried for uploaded text files; cp949 covers legacy Korean files
+TEXT_ENCODINGS = ("utf-8-sig", "cp949")
+
+
+def _decode_text(content: bytes) -> Tuple[Optional[str], str]:
+    """Decode an uploaded text file, returning (text, ocr_status)."""
+    for encoding in TEXT_ENCODINGS:
+        try:
+            return content.decode(encoding), "completed"
+        except UnicodeDecodeError:
+            continue
+    return None, "failed"
+
 
 @router.post("", response_model=ContractResponse, status_code=status.HTTP_201_CREATED)
 async def create_contract(
@@ -77,29 +94,32 @@ async def list_contracts(
     db: AsyncSession = Depends(get_db)
 ):
     """List user's contracts with pagination."""
-    query = select(Contract).where(Contract.user_id == current_user.id)
-
-    if status:
-        query = query.where(Contract.status == status)
-    if contract_type:
-        query = query.where(Contract.contract_type == contract_type)
-
-    query = query.order_by(Contract.created_at.desc())
-
-    # Count total using func.count() for efficiency
-    count_query = select(func.count(Contract.id)).where(Contract.user_id == current_user.id)
+    filters = [Contract.user_id == current_user.id]
     if status:
-        count_query = count_query.where(Contract.status == status)
+        filters.append(Contract.status == status)
     if contract_type:
-        count_query = count_query.where(Contract.contract_type == contract_type)
-
-    result = await db.execute(count_query)
-    total = result.scalar() or 0
-
-    # Apply pagination
-    query = query.offset((page - 1) * page_size).limit(page_size)
+        filters.append(Contract.contract_type == contract_type)
+
+    # count(*) OVER () returns the filtered total with the page in one round-trip
+    query = (
+        select(Contract, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(Contract.created_at.desc())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    )
     result = await db.execute(query)
-    contracts = result.scalars().all()
+    rows = result.all()
+    contracts = [row.Contract for row in rows]
+
+    if rows:
+        total = rows[0].total
+    elif page > 1:
+        # Past the last page there is no row to carry the total
+        result = await db.execute(select(func.count(Contract.id)).where(*filters))
+        total = result.scalar() or 0
+    else:
+        total = 0
 
     return ContractListResponse(
         contracts=[ContractResponse.model_validate(c) for c in contracts],
@@ -213,15 +233,14 @@ async def upload_document(
             detail="Contract not found"
         )
 
-    # Read file content
-    content = await file.read()
+    filename = file.filename or "unknown"
 
-    # Comprehensive file validation (extension, size, and magic bytes)
-    is_valid, error_message = validate_uploaded_file(
-        content=content,
-        filename=file.filename or "unknown",
-        allowed_extensions=settings.ALLOWED_EXTENSIONS,
-        max_size_bytes=settings.MAX_FILE_SIZE
+    # Extension and magic bytes are checked from the first chunk
+    chunk = await file.read(UPLOAD_CHUNK_SIZE)
+    is_valid, error_message = validate_file_header(
+        header=chunk,
+        filename=filename,
+        allowed_extensions=settings.ALLOWED_EXTENSIONS
     )
 
     if not is_valid:
@@ -231,18 +250,32 @@ async def upload_document(
         )
 
     file_ext = file.filename.split(".")[-1].lower() if file.filename else ""
-    file_size = len(content)
 
-    # Calculate hash
-    content_hash = hashlib.sha256(content).hexdigest()
-
-    # Save file
+    # Stream to disk, hashing each chunk; memory stays at one chunk
     upload_dir = os.path.join(settings.UPLOAD_DIR, str(contract_id))
     os.makedirs(upload_dir, exist_ok=True)
 
     file_path = os.path.join(upload_dir, f"{uuid4()}.{file_ext}")
+    hasher = hashlib.sha256()
+    file_size = 0
     async with aiofiles.open(file_path, "wb") as f:
-        await f.write(content)
+        while chunk:
+            file_size += len(chunk)
+            if file_size > settings.MAX_FILE_SIZE:
+                break
+            hasher.update(chunk)
+            await f.write(chunk)
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+
+    if file_size > settings.MAX_FILE_SIZE:
+        os.remove(file_path)
+        max_mb = settings.MAX_FILE_SIZE / (1024 * 1024)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File too large. Maximum size is {max_mb:.1f}MB."
+        )
+
+    content_hash = hasher.hexdigest()
 
     # Get current version
     result = await db.execute(
@@ -261,20 +294,15 @@ async def upload_document(
     ocr_text = None
     ocr_status = "pending"
     if file_ext == "txt":
-        try:
-            ocr_text = content.decode("utf-8")
-            ocr_status = "completed"
-        except UnicodeDecodeError:
-            try:
-                ocr_text = content.decode("cp949")
-                ocr_status = "completed"
-            except UnicodeDecodeError:
-                ocr_status = "failed"
+        async with aiofiles.open(file_path, "rb") as f:
+            content = await f.read()
+        # Multi-MB decodes would otherwise stall the event loop
+        ocr_text, ocr_status = await asyncio.to_thread(_decode_text, content)
 
     # Create document record
     document = ContractDocument(
         contract_id=contract_id,
-        file_name=file.filename or "unknown",
+        file_name=filename,
         file_url=file_path,
         file_type=file_ext,
         file_size=file_size,
@@ -1,17 +1,22 @@
 """DID management API endpoints."""
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, bindparam
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload, load_only
 from pydantic import BaseModel
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
+import asyncio
 
 from app.db.base import get_db
 from app.models.user import User, UserDID, DidStatus, AuthLevel
 from app.api.auth import get_current_user
+from app.services.redis import redis_service
 from app.services.did_baas import get_did_baas_client, DidBaasClient, DidBaasError
+from app.utils.lru_cache import LRUCache
+from app.utils.time import utcnow
 from app.core.exceptions import (
     DIDNotFoundError,
     DIDAlreadyExistsError,
@@ -22,6 +27,58 @@ from app.core.exceptions import (
 
 router = APIRouter(prefix="/did", tags=["DID Management"])
 
+# DID Documents resolve from DID BaaS; a short in-process TTL absorbs
+# repeated reads without a durable copy that can go stale
+did_document_cache = LRUCache(maxsize=10_000, ttl=300)
+
+# /verify is public, so repeated lookups of one DID are answered from memory
+# for a short window; on-chain status changes far slower than that
+verified_did_cache = LRUCache(maxsize=100_000, ttl=30)
+# Upstream calls in progress, so concurrent misses for a DID share one call
+_verify_in_flight: dict[str, asyncio.Future] = {}
+
+# Claims the user's single DID slot before calling DID BaaS. The unique
+# user_id makes a concurrent second issuance wait on this row and then
+# conflict, instead of both passing a SELECT check and minting two DIDs.
+RESERVE_USER_DID = (
+    insert(UserDID)
+    .values(user_id=bindparam("user_id"), status=DidStatus.PENDING)
+    .on_conflict_do_nothing(index_elements=[UserDID.user_id])
+    .returning(UserDID.id)
+)
+
+# Status and revoke only touch these columns; the did_document JSON stays
+# in the database. user_id is unique, so this is a single index lookup.
+SELECT_USER_DID_STATUS = (
+    select(UserDID)
+    .options(load_only(
+        UserDID.did_address,
+        UserDID.status,
+        UserDID.tx_hash,
+        UserDID.block_number,
+        UserDID.confirmed_at
+    ))
+    .where(UserDID.user_id == bindparam("user_id"))
+)
+
+
+async def cached_verify_did(did_client: DidBaasClient, did_address: str) -> dict:
+    """did_client.verify_did through the short-lived verification cache."""
+    result = verified_did_cache.get(did_address)
+    if result is not None:
+        return result
+
+    future = _verify_in_flight.get(did_address)
+    if future is None:
+        future = asyncio.ensure_future(did_client.verify_did(did_address))
+        _verify_in_flight[did_address] = future
+        future.add_done_callback(lambda _: _verify_in_flight.pop(did_address, None))
+
+    # Shielded so one cancelled caller doesn't cancel the call for the others
+    result = await asyncio.shield(future)
+    verified_did_cache.set(did_address, result)
+    return result
+
 
 # ==================== Schemas ====================
 
@@ -71,8 +128,11 @@ async def issue_did(
     This creates a DID on the Xphere blockchain via DID BaaS.
     The DID status will be PENDING until blockchain confirmation.
     """
-    # Check if user already has a DID
-    if current_user.user_did:
+    # Check if user already has a DID by reserving its row; the
+    # reservation is rolled back with the request if issuance fails
+    reserved = await db.execute(RESERVE_USER_DID, {"user_id": current_user.id})
+    user_did_id = reserved.scalar_one_or_none()
+    if user_did_id is None:
         raise DIDAlreadyExistsError()
 
     try:
@@ -84,17 +144,14 @@ async def issue_did(
         if not did_address:
             raise DIDServiceError("No DID address returned from DID BaaS")
 
-        # Create UserDID record
-        user_did = UserDID(
-            user_id=current_user.id,
-            did_address=did_address,
-            status=DidStatus.PENDING,
-            tx_hash=result.get("transactionHash")
+        # Fill in the reserved record
+        await db.execute(
+            update(UserDID)
+            .where(UserDID.id == user_did_id)
+            .values(did_address=did_address, tx_hash=result.get("transactionHash"))
         )
-        db.add(user_did)
-        await db.flush()
 
-        return DidIssueResponse(
+        return DidIssueResponse.model_construct(
             did_address=did_address,
             status="PENDING",
             message="DID creation initiated. Waiting for blockchain confirmation."
@@ -116,9 +173,7 @@ async def get_did_status(
     If status is PENDING, this will check blockchain for confirmation.
     """
     # Get user's DID
-    result = await db.execute(
-        select(UserDID).where(UserDID.user_id == current_user.id)
-    )
+    result = await db.execute(SELECT_USER_DID_STATUS, {"user_id": current_user.id})
     user_did = result.scalar_one_or_none()
 
     if not user_did:
@@ -132,17 +187,18 @@ async def get_did_status(
             if verify_result.get("valid") and verify_result.get("onChainStatus", {}).get("isValid"):
                 # Update status to confirmed
                 user_did.status = DidStatus.CONFIRMED
-                user_did.confirmed_at = datetime.utcnow()
+                user_did.confirmed_at = utcnow()
 
                 # Update user auth level
                 current_user.auth_level = AuthLevel.DID
 
-                await db.flush()
+                await db.commit()
+                await redis_service.invalidate_user_cache(current_user.id)
 
         except DidBaasError:
             pass  # Still pending
 
-    return DidStatusResponse(
+    return DidStatusResponse.model_construct(
         did_address=user_did.did_address,
         status=user_did.status.value.upper(),
         tx_hash=user_did.tx_hash,
@@ -162,9 +218,9 @@ async def verify_did(
     This is a public endpoint - no authentication required.
     """
     try:
-        result = await did_client.verify_did(did_address)
+        result = await cached_verify_did(did_client, did_address)
 
-        return DidVerifyResponse(
+        return DidVerifyResponse.model_construct(
             valid=result.get("valid", False),
             did_address=did_address,
             on_chain_status=result.get("onChainStatus"),
@@ -173,7 +229,7 @@ async def verify_did(
 
     except DidBaasError as e:
         if e.status_code == 404:
-            return DidVerifyResponse(
+            return DidVerifyResponse.model_construct(
                 valid=False,
                 did_address=did_address,
                 on_chain_status=None,
@@ -191,23 +247,23 @@ async def get_did_document(
     """Get the current user's DID Document."""
     # Get user's DID
     result = await db.execute(
-        select(UserDID).where(UserDID.user_id == current_user.id)
+        select(UserDID.did_address).where(UserDID.user_id == current_user.id)
     )
-    user_did = result.scalar_one_or_none()
+    did_address = result.scalar_one_or_none()
 
-    if not user_did:
+    if not did_address:
         raise DIDNotFoundError()
 
-    try:
-        document = await did_client.get_did_document(user_did.did_address)
+    document = did_document_cache.get(did_address)
+    if document is not None:
+        return DidDocumentResponse.model_construct(did_address=did_address, document=document)
 
-        # Cache document in database
-        import json
-        user_did.did_document = json.dumps(document)
-        await db.flush()
+    try:
+        document = await did_client.get_did_document(did_address)
+        did_document_cache.set(did_address, document)
 
-        return DidDocumentResponse(
-            did_address=user_did.did_address,
+        return DidDocumentResponse.model_construct(
+            did_address=did_address,
             document=document
         )
 
@@ -224,9 +280,7 @@ async def revoke_did(
 ):
     """Revoke the current user's DID."""
     # Get user's DID
-    result = await db.execute(
-        select(UserDID).where(UserDID.user_id == current_user.id)
-    )
+    result = await db.execute(SELECT_USER_DID_STATUS, {"user_id": current_user.id})
     user_did = result.scalar_one_or_none()
 
     if not user_did:
@@ -243,9 +297,12 @@ async def revoke_did(
 
         # Update status
         user_did.status = DidStatus.REVOKED
+        did_document_cache.delete(user_did.did_address)
+        verified_did_cache.delete(user_did.did_address)
         current_user.auth_level = AuthLevel.BASIC
 
-        await db.flush()
+        await db.commit()
+        await redis_service.invalidate_user_cache(current_user.id)
 
         return {"success": True, "message": "DID revoked successfully"}
 
@@ -1,8 +1,10 @@
 """Documents API - File upload, download, and OCR processing."""
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 from datetime import datetime
+import asyncio
+import os
 
 from app.core.exceptions import SafeConException, ErrorCode
 from app.core.logging import get_logger
@@ -13,6 +15,28 @@ logger = get_logger("documents")
 
 router = APIRouter(prefix="/documents", tags=["Documents"])
 
+# Uploads are streamed to storage in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def iter_upload(file: UploadFile, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read an upload in chunks; memory stays at one chunk, not the file size."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
+async def iter_fd_at(fd: int, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Read a file descriptor in chunks with positional reads.
+
+    The file offset is never moved, so another reader can use the same
+    file concurrently.
+    """
+    offset = 0
+    while chunk := await asyncio.to_thread(os.pread, fd, chunk_size, offset):
+        offset += len(chunk)
+        yield chunk
+
 
 # ==================== Response Models ====================
 
@@ -73,10 +97,8 @@ async def upload_document(
         )
 
     try:
-        content = await file.read()
-
-        result = await storage.upload_file(
-            content=content,
+        result = await storage.upload_stream(
+            iter_upload(file),
             filename=file.filename,
             content_type=file.content_type
         )
@@ -88,7 +110,7 @@ async def upload_document(
             hash=result["hash"]
         )
 
-        return DocumentUploadResponse(**result)
+        return DocumentUploadResponse.model_construct(**result)
 
     except StorageError as e:
         logger.warning(f"Upload failed: {e}")
@@ -127,21 +149,28 @@ async def upload_and_extract_text(
         )
 
     try:
-        content = await file.read()
-
-        # Upload file
-        upload_result = await storage.upload_file(
-            content=content,
+        # fileno() rolls an in-memory spool over to its temp file; done
+        # before OCR starts so both readers see the same underlying file
+        fd = await asyncio.to_thread(file.file.fileno)
+
+        # Upload and OCR share no data dependency, so the storage write
+        # overlaps OCR; storage reads positionally while OCR owns the offset
+        upload_task = asyncio.create_task(storage.upload_stream(
+            iter_fd_at(fd),
             filename=file.filename,
             content_type=file.content_type
-        )
-
-        # Extract text
-        ocr_result = await ocr.extract_text(
-            content=content,
+        ))
+        ocr_task = asyncio.create_task(ocr.extract_text(
+            content=file.file,
             filename=file.filename,
             language=language
-        )
+        ))
+        try:
+            upload_result, ocr_result = await asyncio.gather(upload_task, ocr_task)
+        except BaseException:
+            upload_task.cancel()
+            ocr_task.cancel()
+            raise
 
         logger.info(
             "document_uploaded_and_extracted",
@@ -150,7 +179,7 @@ async def upload_and_extract_text(
             text_length=len(ocr_result.text)
         )
 
-        return DocumentInfo(
+        return DocumentInfo.model_construct(
             id=upload_result["id"],
             path=upload_result["path"],
             original_filename=upload_result["original_filename"],
@@ -204,10 +233,8 @@ async def extract_text_from_upload(
         )
 
     try:
-        content = await file.read()
-
         result = await ocr.extract_text(
-            content=content,
+            content=file.file,
             filename=file.filename,
             language=language,
             force_ocr=force_ocr
@@ -220,7 +247,7 @@ async def extract_text_from_upload(
             confidence=result.confidence
         )
 
-        return OCRResponse(
+        return OCRResponse.model_construct(
             text=result.text,
             confidence=result.confidence,
             pages=result.pages,
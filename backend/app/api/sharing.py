@@ -208,10 +208,10 @@ async def access_shared_contract(
                 detail="Incorrect password"
             )
 
-    # Get contract
+    # Get contract with only its latest documents (filtered in SQL)
     result = await db.execute(
         select(Contract)
-        .options(selectinload(Contract.documents))
+        .options(selectinload(Contract.documents.and_(ContractDocument.is_latest.is_(True))))
         .where(Contract.id == share_link.contract_id)
     )
     contract = result.scalar_one_or_none()
@@ -228,18 +228,17 @@ async def access_shared_contract(
     # Prepare documents list
     documents = []
     for doc in contract.documents:
-        if doc.is_latest:
-            doc_info = {
-                "id": str(doc.id),
-                "file_name": doc.file_name,
-                "file_type": doc.file_type,
-                "file_size": doc.file_size,
-                "version": doc.version,
-                "created_at": doc.created_at.isoformat()
-            }
-            if share_link.allow_download:
-                doc_info["download_url"] = doc.file_url
-            documents.append(doc_info)
+        doc_info = {
+            "id": str(doc.id),
+            "file_name": doc.file_name,
+            "file_type": doc.file_type,
+            "file_size": doc.file_size,
+            "version": doc.version,
+            "created_at": doc.created_at.isoformat()
+        }
+        if share_link.allow_download:
+            doc_info["download_url"] = doc.file_url
+        documents.append(doc_info)
 
     return SharedContractResponse(
         contract_id=contract.id,
@@ -16,6 +16,7 @@ from app.models.subscription import (
     PlanType, BillingCycle, SubscriptionStatus, PaymentStatus
 )
 from app.api.auth import get_current_user
+from app.services.redis import redis_service
 
 router = APIRouter(prefix="/subscriptions", tags=["Subscriptions"])
 
@@ -425,7 +426,8 @@ async def create_subscription(
     }
     current_user.subscription_tier = tier_mapping.get(plan_type, SubscriptionTier.FREE)
 
-    await db.flush()
+    await db.commit()
+    await redis_service.invalidate_user_cache(current_user.id)
 
     return SubscriptionResponse(
         id=subscription.id,
@@ -485,7 +487,8 @@ async def cancel_subscription(
     # Downgrade user tier
     current_user.subscription_tier = SubscriptionTier.FREE
 
-    await db.flush()
+    await db.commit()
+    await redis_service.invalidate_user_cache(current_user.id)
 
     return {
         "message": "Subscription cancelled successfully",
@@ -638,7 +641,8 @@ async def upgrade_subscription(
     }
     current_user.subscription_tier = tier_mapping.get(plan_type, SubscriptionTier.FREE)
 
-    await db.flush()
+    await db.commit()
+    await redis_service.invalidate_user_cache(current_user.id)
 
     return {
         "message": f"Upgraded to {new_plan.name} plan",
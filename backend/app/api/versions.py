@@ -4,16 +4,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from sqlalchemy.orm import selectinload
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime
-import hashlib
 import os
+import aiofiles
 
 from app.db.base import get_db
 from app.models.user import User
 from app.models.contract import Contract, ContractDocument
 from app.api.auth import get_current_user
+from app.api.documents import iter_upload
+from app.services.storage import copy_chunks, StorageError
 from app.core.config import settings
 
 router = APIRouter(prefix="/versions", tags=["Document Versions"])
@@ -56,28 +58,32 @@ class RevertVersionRequest(BaseModel):
 
 # ==================== Helper Functions ====================
 
-def calculate_file_hash(content: bytes) -> str:
-    """Calculate SHA-256 hash of file content."""
-    return hashlib.sha256(content).hexdigest()
-
+async def save_upload(file: UploadFile, contract_id: str) -> Tuple[str, str, int, str]:
+    """
+    Stream an upload to disk, hashing each chunk as it is written.
 
-async def save_file(content: bytes, filename: str, contract_id: str) -> str:
-    """Save file to storage and return URL."""
+    Returns (url, file_path, size, sha256 hex). Raises StorageError past
+    MAX_FILE_SIZE; the partial file is removed.
+    """
     # Create directory structure
     upload_dir = os.path.join(settings.UPLOAD_DIR, str(contract_id))
     os.makedirs(upload_dir, exist_ok=True)
 
     # Generate unique filename
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    safe_filename = f"{timestamp}_{filename}"
+    safe_filename = f"{timestamp}_{file.filename}"
     file_path = os.path.join(upload_dir, safe_filename)
 
-    # Write file
-    with open(file_path, "wb") as f:
-        f.write(content)
+    # Write file; each byte is read, hashed and written in one pass
+    try:
+        async with aiofiles.open(file_path, "wb") as f:
+            size, content_hash = await copy_chunks(iter_upload(file), f.write, settings.MAX_FILE_SIZE)
+    except BaseException:
+        os.remove(file_path)
+        raise
 
     # Return relative URL
-    return f"/uploads/{contract_id}/{safe_filename}"
+    return f"/uploads/{contract_id}/{safe_filename}", file_path, size, content_hash
 
 
 # ==================== Endpoints ====================
@@ -120,19 +126,15 @@ async def upload_new_version(
             detail=f"File type not allowed. Allowed: {settings.ALLOWED_EXTENSIONS}"
         )
 
-    # Read file content
-    content = await file.read()
-
-    # Check file size
-    if len(content) > settings.MAX_FILE_SIZE:
+    # Save file, hashing it on the way to disk
+    try:
+        file_url, file_path, file_size, content_hash = await save_upload(file, str(contract_id))
+    except StorageError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File too large. Maximum: {settings.MAX_FILE_SIZE // 1024 // 1024}MB"
         )
 
-    # Calculate hash
-    content_hash = calculate_file_hash(content)
-
     # Get current latest version
     result = await db.execute(
         select(ContractDocument)
@@ -145,6 +147,7 @@ async def upload_new_version(
 
     # Check if same content already exists
     if latest_doc and latest_doc.content_hash == content_hash:
+        os.remove(file_path)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Document with identical content already exists"
@@ -153,9 +156,6 @@ async def upload_new_version(
     # Determine version number
     new_version = (latest_doc.version + 1) if latest_doc else 1
 
-    # Save file
-    file_url = await save_file(content, file.filename, str(contract_id))
-
     # Mark previous versions as not latest
     if latest_doc:
         result = await db.execute(
@@ -174,7 +174,7 @@ async def upload_new_version(
         file_name=file.filename,
         file_url=file_url,
         file_type=file_ext,
-        file_size=len(content),
+        file_size=file_size,
         content_hash=content_hash,
         version=new_version,
         is_latest=True
@@ -3,7 +3,9 @@ from .config import settings
 from .database import Base, get_db, init_db
 from .security import (
     verify_password,
+    verify_password_async,
     get_password_hash,
+    get_password_hash_async,
     create_access_token,
     create_refresh_token,
     verify_token,
@@ -15,7 +17,9 @@ __all__ = [
     "get_db",
     "init_db",
     "verify_password",
+    "verify_password_async",
     "get_password_hash",
+    "get_password_hash_async",
     "create_access_token",
     "create_refresh_token",
     "verify_token",
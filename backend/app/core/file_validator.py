@@ -121,6 +121,28 @@ def validate_uploaded_file(
     if not is_valid:
         return False, error
 
+    return validate_file_header(content, filename, allowed_extensions)
+
+
+def validate_file_header(
+    header: bytes,
+    filename: str,
+    allowed_extensions: list
+) -> Tuple[bool, Optional[str]]:
+    """
+    Validate extension and magic bytes from the start of a file.
+
+    Only the first bytes are inspected, so streamed uploads can be checked
+    from their first chunk; the size limit is enforced while streaming.
+
+    Args:
+        header: Leading bytes of the file (at least the first 1000)
+        filename: Original filename
+        allowed_extensions: List of allowed file extensions
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
     # Get and validate extension
     ext = get_file_extension(filename)
     if not ext:
@@ -130,7 +152,7 @@ def validate_uploaded_file(
         return False, f"File type .{ext} is not allowed. Allowed types: {', '.join(allowed_extensions)}"
 
     # Validate magic bytes
-    is_valid, error = validate_magic_bytes(content, ext)
+    is_valid, error = validate_magic_bytes(header, ext)
     if not is_valid:
         return False, error
 
@@ -1,15 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Any
-from jose import jwt, JWTError
+import asyncio
+import hashlib
+import hmac
+import time
+from jose import jwk, jwt, JWTError
+from jose.backends.native import HMACKey
 from passlib.context import CryptContext
 from pydantic import BaseModel
 
 from app.core.config import settings
+from app.utils.lru_cache import LRUCache
 
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt runs in its own pool so login bursts neither block the event loop
+# nor starve other asyncio.to_thread work on the default executor
+password_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+    thread_name_prefix="safecon-kdf"
+)
+
+
+class PrekeyedHMACKey(HMACKey):
+    """
+    HS256/384/512 key that keys the HMAC once and copies it per message.
+
+    hmac.new() re-runs the inner/outer key schedule on every call; copying
+    a keyed HMAC object skips that for each sign and verify.
+    """
+
+    def __init__(self, key, algorithm):
+        super().__init__(key, algorithm)
+        self._keyed = hmac.new(self.prepared_key, digestmod=self._hash_alg)
+
+    def sign(self, msg: bytes) -> bytes:
+        signer = self._keyed.copy()
+        signer.update(msg)
+        return signer.digest()
+
+    def verify(self, msg: bytes, sig: bytes) -> bool:
+        return hmac.compare_digest(sig, self.sign(msg))
+
+
+# JWT key object built once; jose otherwise re-constructs it on every sign/verify
+if settings.JWT_ALGORITHM.startswith("HS"):
+    jwt_signing_key = PrekeyedHMACKey(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+else:
+    jwt_signing_key = jwk.construct(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+jwt_algorithms = [settings.JWT_ALGORITHM]
+
+# Verified token claims keyed by token digest; clients resend the same access
+# token on every request, so most lookups skip signature checks and JSON
+# decoding. Entries never outlive the token's own exp.
+verified_token_cache = LRUCache(maxsize=10_000, ttl=60)
+
 
 class TokenData(BaseModel):
     user_id: str
@@ -24,6 +72,35 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        password_hash_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Generate password hash without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_hash_executor, get_password_hash, password)
+
+
+def failed_login_key(email: str, password: str) -> str:
+    """
+    Redis key marking an email/password pair as recently rejected.
+
+    Keyed with an HMAC so a dump of Redis reveals nothing about the
+    attempted passwords.
+    """
+    digest = hmac.new(
+        settings.JWT_SECRET_KEY.encode(),
+        f"{email.lower()}:{password}".encode(),
+        hashlib.sha256
+    ).hexdigest()
+    return f"badpw:{digest}"
+
+
 def get_password_hash(password: str) -> str:
     """Generate password hash."""
     return pwd_context.hash(password)
@@ -34,25 +111,11 @@ def create_access_token(
     expires_delta: Optional[timedelta] = None
 ) -> str:
     """Create JWT access token."""
-    to_encode = data.copy()
-
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-
-    to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
-        "type": "access"
-    })
-
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM
+    return _encode_token(
+        data,
+        expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        "access"
     )
-    return encoded_jwt
 
 
 def create_refresh_token(
@@ -60,25 +123,23 @@ def create_refresh_token(
     expires_delta: Optional[timedelta] = None
 ) -> str:
     """Create JWT refresh token."""
-    to_encode = data.copy()
-
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-
-    to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
-        "type": "refresh"
-    })
-
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM
+    return _encode_token(
+        data,
+        expires_delta or timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        "refresh"
     )
-    return encoded_jwt
+
+
+def _encode_token(data: dict, expires_delta: timedelta, token_type: str) -> str:
+    now = datetime.utcnow()
+    to_encode = {
+        **data,
+        "exp": now + expires_delta,
+        "iat": now,
+        "type": token_type
+    }
+
+    return jwt.encode(to_encode, jwt_signing_key, algorithm=settings.JWT_ALGORITHM)
 
 
 def decode_token(token: str) -> Optional[dict]:
@@ -86,8 +147,8 @@ def decode_token(token: str) -> Optional[dict]:
     try:
         payload = jwt.decode(
             token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
+            jwt_signing_key,
+            algorithms=jwt_algorithms
         )
         return payload
     except JWTError:
@@ -96,6 +157,15 @@ def decode_token(token: str) -> Optional[dict]:
 
 def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
     """Verify token and return token data."""
+    cache_key = (hashlib.sha256(token.encode()).digest(), token_type)
+    cached = verified_token_cache.get(cache_key)
+    if cached is not None:
+        token_data, expires_at = cached
+        if expires_at > time.time():
+            return token_data
+        verified_token_cache.delete(cache_key)
+        return None
+
     payload = decode_token(token)
 
     if payload is None:
@@ -112,6 +182,10 @@ def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
             tier=payload.get("tier", "free"),
             token_type=payload.get("type")
         )
-        return token_data
     except Exception:
         return None
+
+    if "exp" in payload:
+        verified_token_cache.set(cache_key, (token_data, payload["exp"]))
+
+    return token_data
@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import MetaData
+from sqlalchemy import MetaData, text
 
 from app.core.config import settings
 
@@ -19,14 +19,30 @@ class Base(DeclarativeBase):
     metadata = MetaData(naming_convention=convention)
 
 
+# TCP keepalives let Postgres drop dead connections without a pre-ping
+# round-trip on every checkout
+connect_args = {}
+if settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+    connect_args["server_settings"] = {
+        "tcp_keepalives_idle": str(settings.DATABASE_TCP_KEEPALIVES_IDLE)
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DATABASE_ECHO,
-    future=True
+    future=True,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    connect_args=connect_args
 )
 
 # Create async session factory
+# expire_on_commit=False keeps attributes readable after commit without an
+# implicit SELECT (background tasks read results after committing).
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -48,10 +64,25 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+# Move the certificate serial past numbers issued before the sequence
+# existed (the old COUNT-based scheme); a no-op once it is ahead
+SYNC_CERTIFICATE_NUMBER_SEQ = text("""
+    SELECT setval('certificate_number_seq', issued.max_serial)
+    FROM (
+        SELECT max(split_part(certificate_number, '-', 3)::bigint) AS max_serial
+        FROM certificates
+        WHERE certificate_number ~ '^SC-[0-9]{4}-[0-9]+$'
+    ) AS issued
+    WHERE issued.max_serial >= (SELECT last_value FROM certificate_number_seq)
+""")
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        if conn.dialect.name == "postgresql":
+            await conn.execute(SYNC_CERTIFICATE_NUMBER_SEQ)
 
 
 async def close_db():
@@ -1,12 +1,20 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 
 from app.core.config import settings
 from app.core.error_handlers import register_exception_handlers
 from app.core.logging import setup_logging, get_logger, RequestLoggingMiddleware
 from app.db.base import init_db, close_db
 from app.services.redis import redis_service
+from app.services.analysis_worker import analysis_worker
+from app.services.gemini import gemini_client
+from app.services.did_baas import did_baas_client
+from app.services.login_tracker import last_login_recorder
+from app.services.usage_tracker import api_usage_recorder
 from app.api import auth, contracts, analysis, did, signatures, blockchain, parties, versions, sharing, templates, subscriptions, b2b, documents
 
 # Initialize structured logging
@@ -24,21 +32,45 @@ async def lifespan(app: FastAPI):
         version=settings.APP_VERSION,
         debug=settings.DEBUG
     )
+    # Bound the default executor used by asyncio.to_thread for CPU-bound work
+    executor = ThreadPoolExecutor(
+        max_workers=settings.THREAD_POOL_MAX_WORKERS,
+        thread_name_prefix="safecon-worker"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+
     await init_db()
     logger.info("database_connected")
 
     # Initialize Redis (optional - graceful degradation if unavailable)
     try:
         await redis_service.connect()
+        await redis_service.start_blacklist_sync()
         logger.info("redis_connected")
     except Exception as e:
         logger.warning("redis_connection_failed", error=str(e), message="Running without Redis")
 
+    # Build the Gemini SDK client now instead of on the first AI request
+    if not gemini_client.is_available():
+        logger.warning("gemini_client_unavailable")
+
+    # One DID BaaS connection pool for the process lifetime
+    await did_baas_client.connect()
+
+    analysis_worker.start()
+    last_login_recorder.start()
+    api_usage_recorder.start()
+
     yield
     # Shutdown
     logger.info("application_shutdown")
+    await analysis_worker.stop()
+    await last_login_recorder.stop()
+    await api_usage_recorder.stop()
+    await did_baas_client.close()
     await redis_service.disconnect()
     await close_db()
+    executor.shutdown(wait=False)
     logger.info("services_disconnected")
 
 
@@ -47,7 +79,9 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="AI-powered contract analysis and management platform",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes every endpoint's response body (DID documents, OCR text)
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -21,6 +21,7 @@ from app.models.blockchain import (
     Certificate,
     AnchorStatus
 )
+from app.models.api_key import ApiKey
 
 __all__ = [
     # User
@@ -46,4 +47,6 @@ __all__ = [
     "BlockchainRecord",
     "Certificate",
     "AnchorStatus",
+    # B2B
+    "ApiKey",
 ]
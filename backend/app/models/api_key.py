@@ -0,0 +1,33 @@
+"""B2B API key model."""
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean
+from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import datetime
+import uuid
+
+from app.db.base import Base
+
+
+class ApiKey(Base):
+    """API key for B2B access. Only the keyed hash of the key is stored."""
+    __tablename__ = "api_keys"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+
+    # Key info
+    name = Column(String(100), nullable=False)
+    key_hash = Column(String(32), nullable=False, unique=True, index=True)  # BLAKE2b-128 hex
+    key_prefix = Column(String(20), nullable=False)
+    scopes = Column(JSONB, nullable=False, default=list)
+
+    # Status
+    is_active = Column(Boolean, default=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=True)
+    last_used_at = Column(DateTime, nullable=True)
+
+    # Relationship
+    user = relationship("User")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Enum, Text, Integer, ForeignKey, BigInteger
+from sqlalchemy import Column, String, DateTime, Enum, Text, Integer, ForeignKey, BigInteger, LargeBinary, Sequence, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime
@@ -18,6 +18,11 @@ class AnchorStatus(str, enum.Enum):
 
 class BlockchainRecord(Base):
     __tablename__ = "blockchain_records"
+    __table_args__ = (
+        Index('ix_blockchain_records_contract_hash_status', 'contract_id', 'document_hash', 'status'),
+        Index('ix_blockchain_records_hash_status', 'document_hash', 'status'),
+        Index('ix_blockchain_records_contract_created', 'contract_id', 'created_at'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     contract_id = Column(UUID(as_uuid=True), ForeignKey("contracts.id"), nullable=False)
@@ -28,7 +33,7 @@ class BlockchainRecord(Base):
     salt = Column(String(64), nullable=True)  # Random salt for privacy
 
     # Merkle tree
-    merkle_root = Column(String(64), nullable=True)
+    merkle_root = Column(LargeBinary(32), nullable=True)  # Raw SHA-256; hex only in API responses
     merkle_proof = Column(JSONB, nullable=True)  # Array of hashes
     batch_id = Column(String(50), nullable=True)
 
@@ -55,6 +60,11 @@ class BlockchainRecord(Base):
     certificate = relationship("Certificate", back_populates="blockchain_record", uselist=False)
 
 
+# Serial part of certificate numbers (SC-{year}-{serial}); nextval is atomic,
+# so concurrent issuance never hands out the same number
+certificate_number_seq = Sequence("certificate_number_seq", metadata=Base.metadata)
+
+
 class Certificate(Base):
     __tablename__ = "certificates"
 
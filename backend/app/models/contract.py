@@ -42,6 +42,8 @@ class Contract(Base):
         Index('ix_contracts_user_id', 'user_id'),
         Index('ix_contracts_created_at', 'created_at'),
         Index('ix_contracts_user_status', 'user_id', 'status'),
+        # Keyset pagination: newest first per user, id breaks created_at ties
+        Index('ix_contracts_user_created_id', 'user_id', 'created_at', 'id'),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -72,6 +74,9 @@ class Contract(Base):
 
 class ContractDocument(Base):
     __tablename__ = "contract_documents"
+    __table_args__ = (
+        Index('ix_contract_documents_contract_version', 'contract_id', 'version'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     contract_id = Column(UUID(as_uuid=True), ForeignKey("contracts.id"), nullable=False)
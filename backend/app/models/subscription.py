@@ -1,5 +1,5 @@
 """Subscription and billing models."""
-from sqlalchemy import Column, String, DateTime, Enum, Text, Integer, ForeignKey, Boolean, Numeric
+from sqlalchemy import Column, String, DateTime, Enum, Text, Integer, ForeignKey, Boolean, Numeric, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime
@@ -113,6 +113,10 @@ class UserSubscription(Base):
 class UsageRecord(Base):
     """Track user usage for billing and limits."""
     __tablename__ = "usage_records"
+    __table_args__ = (
+        # One record per user and period; usage counters upsert against it
+        UniqueConstraint('user_id', 'period_start', name='uq_usage_records_user_period'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, String, DateTime, Enum, Text, Boolean, ForeignKey
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime
 import uuid
 import enum
@@ -72,8 +72,9 @@ class UserDID(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, unique=True)
-    did_address = Column(String(255), nullable=False, unique=True)  # did:sw:org:0x...
-    did_document = Column(Text, nullable=True)  # JSON string
+    # NULL only while issue_did holds the reservation (never committed)
+    did_address = Column(String(255), nullable=True, unique=True)  # did:sw:org:0x...
+    did_document = Column(JSONB, nullable=True)  # Legacy; documents resolve from DID BaaS
     status = Column(Enum(DidStatus), default=DidStatus.PENDING)
 
     # Blockchain info
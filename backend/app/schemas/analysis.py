@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -35,8 +35,7 @@ class ClauseResponse(BaseModel):
     suggestion: Optional[str] = None
     negotiation_script: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QuestionResponse(BaseModel):
@@ -45,8 +44,7 @@ class QuestionResponse(BaseModel):
     context: Optional[str] = None
     priority: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AnalysisResponse(BaseModel):
@@ -60,16 +58,14 @@ class AnalysisResponse(BaseModel):
     created_at: datetime
     completed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AnalysisDetailResponse(AnalysisResponse):
     clauses: List[ClauseResponse] = []
     questions: List[QuestionResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AnalysisStartResponse(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
@@ -38,8 +38,24 @@ class UserResponse(UserBase):
     email_verified: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, user) -> "UserResponse":
+        """Build from a loaded User row without re-validating trusted columns."""
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            auth_level=user.auth_level.value,
+            subscription_tier=user.subscription_tier.value,
+            phone=user.phone,
+            business_type=user.business_type,
+            business_description=user.business_description,
+            legal_concerns=user.legal_concerns,
+            email_verified=bool(user.email_verified),
+            created_at=user.created_at
+        )
 
 
 class Token(BaseModel):
@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from typing import Optional, List
 from google import genai
 from app.core.config import settings
@@ -11,6 +12,12 @@ from app.services.risk_patterns import (
 )
 
 
+@lru_cache(maxsize=1)
+def get_genai_client() -> genai.Client:
+    """Process-wide Gemini SDK client; built once and reused by every analysis."""
+    return genai.Client(api_key=settings.GEMINI_API_KEY)
+
+
 async def analyze_contract_text(
     contract_text: str,
     user_context: Optional[str] = None,
@@ -29,8 +36,7 @@ async def analyze_contract_text(
     pattern_risks = detect_pattern_risks(contract_text, lang)
     pattern_score = calculate_pattern_score(pattern_risks)
 
-    # Initialize Gemini client
-    client = genai.Client(api_key=settings.GEMINI_API_KEY)
+    client = get_genai_client()
 
     # Build system prompt
     system_prompt = """You are a Korean contract law expert AI assistant.
@@ -91,7 +97,7 @@ Return ONLY the JSON object, no additional text.
 """
 
     try:
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model="gemini-2.0-flash-exp",
             contents=user_prompt,
             config={
@@ -0,0 +1,197 @@
+"""Background worker pool for AI contract analysis."""
+import asyncio
+import time
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import update, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.base import async_session_maker
+from app.models.analysis import AIAnalysis, AnalysisClause, AnalysisQuestion, AnalysisStatus, RiskLevel
+from app.services.ai_analyzer import analyze_contract_text
+
+logger = get_logger("analysis_worker")
+
+
+async def run_analysis(
+    analysis_id: UUID,
+    contract_text: str,
+    user_context: str,
+    session_factory: async_sessionmaker[AsyncSession]
+):
+    """
+    Run AI analysis for a queued analysis record.
+
+    Opens its own sessions from ``session_factory``; the request-scoped
+    session is closed by the time this runs. PROCESSING is committed before
+    the AI call and the results are written in a second transaction, so
+    pollers see progress and no connection is held during the call.
+    """
+    start_time = time.time()
+
+    async with session_factory() as db:
+        result = await db.execute(
+            update(AIAnalysis)
+            .where(AIAnalysis.id == analysis_id)
+            .values(status=AnalysisStatus.PROCESSING)
+            .returning(AIAnalysis.id)
+        )
+        if result.scalar_one_or_none() is None:
+            return
+        await db.commit()
+
+    async with session_factory() as db:
+        try:
+            # Run AI analysis
+            ai_result = await analyze_contract_text(contract_text, user_context)
+
+            # Update analysis with results
+            await db.execute(
+                update(AIAnalysis)
+                .where(AIAnalysis.id == analysis_id)
+                .values(
+                    safety_score=ai_result.get("score", 0),
+                    summary=ai_result.get("summary", ""),
+                    status=AnalysisStatus.COMPLETED,
+                    completed_at=datetime.utcnow(),
+                    processing_time_ms=int((time.time() - start_time) * 1000),
+                    model_version=ai_result.get("model", "gemini-2.0-flash")
+                )
+            )
+
+            risks = ai_result.get("risks") or []
+            questions = ai_result.get("questions") or []
+            question_count = len(questions)
+
+            # Add risk clauses
+            clause_rows = [
+                {
+                    "analysis_id": analysis_id,
+                    "clause_text": risk.get("title", ""),
+                    "risk_level": RiskLevel(risk.get("level", "caution").lower()),
+                    "explanation": risk.get("description", ""),
+                    "suggestion": risk.get("suggestion", ""),
+                    "display_order": idx
+                }
+                for idx, risk in enumerate(risks)
+            ]
+
+            # Add recommended questions
+            question_rows = [
+                {
+                    "analysis_id": analysis_id,
+                    "question": question,
+                    "priority": question_count - idx
+                }
+                for idx, question in enumerate(questions)
+            ]
+
+            # One executemany per table instead of a row-by-row INSERT
+            if clause_rows:
+                await db.execute(insert(AnalysisClause), clause_rows)
+            if question_rows:
+                await db.execute(insert(AnalysisQuestion), question_rows)
+
+            await db.commit()
+
+        except Exception as e:
+            await db.rollback()
+
+            # Update status to failed
+            await db.execute(
+                update(AIAnalysis)
+                .where(AIAnalysis.id == analysis_id)
+                .values(status=AnalysisStatus.FAILED, error_message=str(e))
+            )
+            await db.commit()
+
+
+class AnalysisWorker:
+    """
+    In-process queue of analysis jobs drained by a fixed number of workers.
+
+    Keeps slow Gemini calls off the request path and bounds how many run
+    concurrently, so a burst of uploads cannot exhaust the AI quota.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = None,
+        session_factory: async_sessionmaker[AsyncSession] = None
+    ):
+        self.concurrency = concurrency or settings.ANALYSIS_WORKER_CONCURRENCY
+        self._session_factory = session_factory or async_session_maker
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def is_running(self) -> bool:
+        """Check if worker tasks are running."""
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Start worker tasks on the running event loop."""
+        if self._workers:
+            return
+
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"analysis-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        logger.info("analysis_workers_started", concurrency=self.concurrency)
+
+    async def stop(self) -> None:
+        """Cancel worker tasks. Queued jobs that have not started are dropped."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        logger.info("analysis_workers_stopped")
+
+    async def enqueue(
+        self,
+        analysis_id: UUID,
+        contract_text: str,
+        user_context: str
+    ) -> None:
+        """Queue an analysis job, starting workers on first use."""
+        if not self._workers:
+            self.start()
+
+        await self._queue.put((analysis_id, contract_text, user_context))
+
+    async def _worker(self, worker_id: int) -> None:
+        """Process queued jobs until cancelled."""
+        while True:
+            analysis_id, contract_text, user_context = await self._queue.get()
+            try:
+                await run_analysis(
+                    analysis_id,
+                    contract_text,
+                    user_context,
+                    self._session_factory
+                )
+            except Exception as e:
+                logger.error(
+                    "analysis_job_failed",
+                    analysis_id=str(analysis_id),
+                    worker=worker_id,
+                    error=str(e)
+                )
+            finally:
+                self._queue.task_done()
+
+
+# Singleton instance
+analysis_worker = AnalysisWorker()
+
+
+async def get_analysis_worker() -> AnalysisWorker:
+    """Dependency for getting the analysis worker."""
+    return analysis_worker
@@ -1,13 +1,23 @@
 """Certificate generation service for blockchain-verified documents."""
 import os
 import io
+import asyncio
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
+from uuid import UUID
 from jinja2 import Environment, FileSystemLoader
+from sqlalchemy import select, update
+from sqlalchemy.orm import selectinload
 
 from app.utils.qrcode import generate_qr_code
 from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.base import async_session_maker
+from app.models.blockchain import BlockchainRecord, Certificate
+from app.services.storage import storage_service
+
+logger = get_logger("certificate")
 
 
 # Template directory
@@ -22,6 +32,26 @@ class CertificateService:
             loader=FileSystemLoader(str(TEMPLATE_DIR)),
             autoescape=True
         )
+        # Anchors whose PDF is being rendered, so repeated polls don't
+        # queue the same job twice
+        self._rendering: set[UUID] = set()
+        # Set to False once neither weasyprint nor playwright imports, so
+        # certificate polls stop queueing renders that can never succeed
+        self.pdf_available: Optional[bool] = None
+
+    @staticmethod
+    def record_fields(record: BlockchainRecord) -> dict:
+        """Template arguments for an anchor with contract and certificate loaded."""
+        return {
+            "certificate_number": record.certificate.certificate_number,
+            "contract_title": record.contract.title if record.contract else "Untitled Contract",
+            "document_hash": record.document_hash,
+            "tx_hash": record.tx_hash or "pending",
+            "block_number": record.block_number or 0,
+            "network": record.network,
+            "anchored_at": record.confirmed_at or datetime.utcnow(),
+            "verification_url": record.certificate.verification_url,
+        }
 
     def generate_certificate_html(
         self,
@@ -91,7 +121,10 @@ class CertificateService:
         Returns:
             PDF bytes or None if conversion fails
         """
-        html = self.generate_certificate_html(
+        # QR encoding and template rendering are CPU work; keep them and
+        # the weasyprint layout below off the event loop
+        html = await asyncio.to_thread(
+            self.generate_certificate_html,
             certificate_number=certificate_number,
             contract_title=contract_title,
             document_hash=document_hash,
@@ -106,10 +139,9 @@ class CertificateService:
         try:
             from weasyprint import HTML
 
-            pdf_buffer = io.BytesIO()
-            HTML(string=html).write_pdf(pdf_buffer)
-            pdf_buffer.seek(0)
-            return pdf_buffer.getvalue()
+            pdf_bytes = await asyncio.to_thread(self._write_pdf, html)
+            self.pdf_available = True
+            return pdf_bytes
         except ImportError:
             pass
 
@@ -132,13 +164,90 @@ class CertificateService:
                     }
                 )
                 await browser.close()
+                self.pdf_available = True
                 return pdf_bytes
         except ImportError:
             pass
 
         # If no PDF library available, return None
+        self.pdf_available = False
         return None
 
+    @staticmethod
+    def _write_pdf(html: str) -> bytes:
+        """Lay out HTML with weasyprint; blocking, so run in a worker thread."""
+        from weasyprint import HTML
+
+        pdf_buffer = io.BytesIO()
+        HTML(string=html).write_pdf(pdf_buffer)
+        return pdf_buffer.getvalue()
+
+    async def store_pdf(self, certificate_id: UUID, certificate_number: str, pdf_bytes: bytes) -> str:
+        """Upload a rendered PDF and record its storage path on the certificate."""
+        stored = await storage_service.upload_file(
+            pdf_bytes,
+            f"SafeCon_Certificate_{certificate_number}.pdf",
+            content_type="application/pdf"
+        )
+
+        async with async_session_maker() as db:
+            await db.execute(
+                update(Certificate)
+                .where(Certificate.id == certificate_id)
+                .values(pdf_url=stored["path"])
+            )
+            await db.commit()
+
+        return stored["path"]
+
+    def can_queue_pdf(self, record_id: UUID) -> bool:
+        """Whether a background render for this anchor would do any work."""
+        return self.pdf_available is not False and record_id not in self._rendering
+
+    async def generate_and_store_pdf(self, record_id: UUID) -> Optional[str]:
+        """
+        Render an anchor's certificate PDF once and keep it in storage.
+
+        Runs as a background task after the certificate is committed;
+        downloads then serve the stored file instead of rendering again.
+
+        Returns:
+            Storage path, or None if skipped or no PDF library is available
+        """
+        if not self.can_queue_pdf(record_id):
+            return None
+
+        self._rendering.add(record_id)
+        try:
+            async with async_session_maker() as db:
+                result = await db.execute(
+                    select(BlockchainRecord)
+                    .options(
+                        selectinload(BlockchainRecord.contract),
+                        selectinload(BlockchainRecord.certificate)
+                    )
+                    .where(BlockchainRecord.id == record_id)
+                )
+                record = result.scalar_one_or_none()
+
+            if record is None or record.certificate is None or record.certificate.pdf_url:
+                return None
+
+            pdf_bytes = await self.generate_certificate_pdf(**self.record_fields(record))
+            if pdf_bytes is None:
+                return None
+
+            return await self.store_pdf(
+                record.certificate.id,
+                record.certificate.certificate_number,
+                pdf_bytes
+            )
+        except Exception as e:
+            logger.error("certificate_pdf_failed", record_id=str(record_id), error=str(e))
+            return None
+        finally:
+            self._rendering.discard(record_id)
+
 
 # Singleton instance
 certificate_service = CertificateService()
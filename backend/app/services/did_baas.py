@@ -1,12 +1,13 @@
 """DID BaaS Client for Xphere blockchain integration."""
 import httpx
+import importlib.util
 from typing import Optional, Dict, Any, List
-from datetime import datetime
 import uuid
 import hashlib
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.utils.time import utcnow
 
 logger = get_logger("did_baas")
 
@@ -33,6 +34,10 @@ class MockDidBaasClient:
         self._mock_credentials: Dict[str, Dict] = {}
         logger.warning("DID BaaS running in MOCK MODE - no real blockchain operations")
 
+    async def connect(self):
+        """No-op for mock client."""
+        pass
+
     async def close(self):
         """No-op for mock client."""
         pass
@@ -65,7 +70,7 @@ class MockDidBaasClient:
             "civilId": civil_id,
             "status": "CONFIRMED",
             "transactionHash": mock_tx_hash,
-            "issuedAt": datetime.utcnow().isoformat() + "Z"
+            "issuedAt": utcnow().isoformat() + "Z"
         }
 
         logger.info(f"[MOCK] Issued DID: {did_address}")
@@ -94,7 +99,7 @@ class MockDidBaasClient:
             "valid": True,
             "onChainStatus": {
                 "isValid": True,
-                "issuedAt": datetime.utcnow().isoformat() + "Z"
+                "issuedAt": utcnow().isoformat() + "Z"
             }
         }
 
@@ -147,14 +152,14 @@ class MockDidBaasClient:
             "id": credential_id,
             "type": ["VerifiableCredential", schema_id],
             "issuer": issuer_did,
-            "issuanceDate": datetime.utcnow().isoformat() + "Z",
+            "issuanceDate": utcnow().isoformat() + "Z",
             "credentialSubject": {
                 "id": subject_did,
                 **claims
             },
             "proof": {
                 "type": "JwtProof2020",
-                "created": datetime.utcnow().isoformat() + "Z",
+                "created": utcnow().isoformat() + "Z",
                 "jws": f"mock_jws_{hashlib.sha256(credential_id.encode()).hexdigest()[:32]}"
             }
         }
@@ -213,7 +218,7 @@ class MockDidBaasClient:
         claims = {
             "contractId": contract_id,
             "contractHash": contract_hash,
-            "signedAt": datetime.utcnow().isoformat() + "Z",
+            "signedAt": utcnow().isoformat() + "Z",
             "signatureType": signature_type
         }
 
@@ -249,7 +254,13 @@ class DidBaasClient:
         self._client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
+        """
+        Get or create the shared HTTP client.
+
+        One pooled client per process keeps connections (and TLS sessions)
+        alive across requests; HTTP/2 multiplexes concurrent calls over
+        one connection when h2 is installed.
+        """
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
@@ -257,10 +268,19 @@ class DidBaasClient:
                     "X-API-Key": self.api_key,
                     "Content-Type": "application/json"
                 },
-                timeout=self.timeout
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.DID_BAAS_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.DID_BAAS_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                http2=settings.DID_BAAS_HTTP2 and importlib.util.find_spec("h2") is not None
             )
         return self._client
 
+    async def connect(self):
+        """Create the HTTP client at startup rather than on the first request."""
+        await self._get_client()
+
     async def close(self):
         """Close the HTTP client."""
         if self._client and not self._client.is_closed:
@@ -453,7 +473,7 @@ class DidBaasClient:
         claims = {
             "contractId": contract_id,
             "contractHash": contract_hash,
-            "signedAt": datetime.utcnow().isoformat() + "Z",
+            "signedAt": utcnow().isoformat() + "Z",
             "signatureType": signature_type
         }
 
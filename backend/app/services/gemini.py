@@ -1,6 +1,6 @@
 """Gemini AI Service for contract analysis and legal assistance."""
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
 
@@ -351,18 +351,10 @@ class GeminiClient:
         try:
             client = self._get_client()
 
-            config = {
-                "temperature": 0.7,
-                "max_output_tokens": 2048
-            }
-
-            if system_instruction:
-                config["system_instruction"] = system_instruction
-
             response = client.models.generate_content(
                 model="gemini-2.0-flash",
                 contents=prompt,
-                config=config
+                config=self._text_config(system_instruction)
             )
 
             return response.text
@@ -395,36 +387,10 @@ class GeminiClient:
         try:
             client = self._get_client()
 
-            # Build conversation contents
-            contents = []
-
-            # Add history
-            if history:
-                for role, text in history:
-                    gemini_role = "model" if role == "assistant" else "user"
-                    contents.append({
-                        "role": gemini_role,
-                        "parts": [{"text": text}]
-                    })
-
-            # Add current message
-            contents.append({
-                "role": "user",
-                "parts": [{"text": message}]
-            })
-
-            config = {
-                "temperature": 0.7,
-                "max_output_tokens": 2048
-            }
-
-            if system_instruction:
-                config["system_instruction"] = system_instruction
-
             response = client.models.generate_content(
                 model="gemini-2.0-flash",
-                contents=contents,
-                config=config
+                contents=self._build_chat_contents(message, history),
+                config=self._text_config(system_instruction)
             )
 
             return response.text
@@ -433,6 +399,114 @@ class GeminiClient:
             logger.error(f"Gemini chat failed: {e}")
             raise AIServiceError(f"Chat failed: {str(e)}")
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_instruction: str = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a text response from Gemini as it is generated.
+
+        Args:
+            prompt: The prompt text
+            system_instruction: Optional system instruction
+
+        Yields:
+            Text chunks in generation order
+        """
+        if self._mock_mode:
+            logger.info("[MOCK] Streaming text")
+            yield f"[MOCK RESPONSE] This is a mock response to: {prompt[:100]}..."
+            return
+
+        async for text in self._stream_content(prompt, system_instruction, "Text generation"):
+            yield text
+
+    async def chat_stream(
+        self,
+        message: str,
+        history: List[tuple] = None,
+        system_instruction: str = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat reply from Gemini as it is generated.
+
+        Args:
+            message: The user's message
+            history: List of (role, text) tuples for conversation history
+            system_instruction: Optional system instruction
+
+        Yields:
+            Text chunks in generation order
+        """
+        if self._mock_mode:
+            logger.info("[MOCK] Streaming chat response")
+            yield f"[MOCK] Thank you for your question about: {message[:100]}... I would provide helpful legal information here."
+            return
+
+        contents = self._build_chat_contents(message, history)
+        async for text in self._stream_content(contents, system_instruction, "Chat"):
+            yield text
+
+    async def _stream_content(
+        self,
+        contents: Any,
+        system_instruction: Optional[str],
+        operation: str
+    ) -> AsyncIterator[str]:
+        """Yield non-empty text chunks from a streaming generate_content call."""
+        try:
+            client = self._get_client()
+
+            # An async generator in google-genai 0.3.0, so it is iterated
+            # directly rather than awaited
+            async for chunk in client.aio.models.generate_content_stream(
+                model="gemini-2.0-flash",
+                contents=contents,
+                config=self._text_config(system_instruction)
+            ):
+                if chunk.text:
+                    yield chunk.text
+
+        except Exception as e:
+            logger.error(f"Gemini {operation.lower()} stream failed: {e}")
+            raise AIServiceError(f"{operation} failed: {str(e)}")
+
+    @staticmethod
+    def _build_chat_contents(message: str, history: List[tuple] = None) -> List[Dict[str, Any]]:
+        """Build Gemini conversation contents from history plus the new message."""
+        contents = []
+
+        # Add history
+        if history:
+            for role, text in history:
+                gemini_role = "model" if role == "assistant" else "user"
+                contents.append({
+                    "role": gemini_role,
+                    "parts": [{"text": text}]
+                })
+
+        # Add current message
+        contents.append({
+            "role": "user",
+            "parts": [{"text": message}]
+        })
+
+        return contents
+
+    @staticmethod
+    def _text_config(system_instruction: Optional[str] = None) -> Dict[str, Any]:
+        """Generation config shared by free-text generate and chat calls."""
+        config = {
+            "temperature": 0.7,
+            "max_output_tokens": 2048
+        }
+
+        if system_instruction:
+            config["system_instruction"] = system_instruction
+
+        return config
+
 
 # Singleton instance
 gemini_client = GeminiClient()
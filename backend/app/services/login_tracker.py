@@ -0,0 +1,96 @@
+"""Batched last-login timestamp writes."""
+import asyncio
+import time
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import update, case
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.base import async_session_maker
+from app.models.user import User
+from app.utils.time import utcfromtimestamp
+
+logger = get_logger("login_tracker")
+
+
+class LastLoginRecorder:
+    """
+    Buffers last_login_at timestamps and writes them in one UPDATE per interval.
+
+    Login only records the timestamp in memory, so the response no longer
+    waits on a write; repeated logins by the same user within an interval
+    collapse into a single row update.
+    """
+
+    def __init__(
+        self,
+        interval: float = None,
+        session_factory: async_sessionmaker[AsyncSession] = None
+    ):
+        self.interval = interval or settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS
+        self._session_factory = session_factory or async_session_maker
+        # Epoch seconds; converted to datetimes once per flush, not per login
+        self._pending: dict[UUID, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of users waiting to be written."""
+        return len(self._pending)
+
+    def record(self, user_id: UUID, logged_in_at: Optional[float] = None) -> None:
+        """Record a login (epoch seconds, default now); the latest per user wins."""
+        self._pending[user_id] = logged_in_at if logged_in_at is not None else time.time()
+
+    def start(self) -> None:
+        """Start the periodic flush task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="last-login-recorder")
+
+    async def stop(self) -> None:
+        """Stop the flush task and write anything still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Write buffered timestamps in a single UPDATE. Returns rows queued."""
+        if not self._pending:
+            return 0
+
+        pending = {
+            user_id: utcfromtimestamp(logged_in_at)
+            for user_id, logged_in_at in self._pending.items()
+        }
+        self._pending = {}
+
+        try:
+            async with self._session_factory() as db:
+                await db.execute(
+                    update(User)
+                    .where(User.id.in_(pending.keys()))
+                    .values(last_login_at=case(pending, value=User.id)),
+                    execution_options={"synchronize_session": False}
+                )
+                await db.commit()
+        except Exception as e:
+            # Best effort: last_login_at is informational, don't retry forever
+            logger.error("last_login_flush_failed", users=len(pending), error=str(e))
+            return 0
+
+        return len(pending)
+
+    async def _run(self) -> None:
+        """Flush on a fixed interval until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+
+# Singleton instance
+last_login_recorder = LastLoginRecorder()
@@ -1,6 +1,10 @@
 """OCR Service for extracting text from documents and images."""
 import io
-from typing import Optional, List, Dict, Any
+import asyncio
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, BinaryIO, Union
 from pathlib import Path
 from abc import ABC, abstractmethod
 
@@ -15,6 +19,18 @@ class OCRError(Exception):
     pass
 
 
+# Document content: bytes, or a seekable file such as an upload's spooled file
+Content = Union[bytes, BinaryIO]
+
+
+def open_content(content: Content) -> BinaryIO:
+    """Readable stream over content positioned at the start; files are not copied."""
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return io.BytesIO(content)
+    content.seek(0)
+    return content
+
+
 class OCRResult:
     """OCR extraction result."""
 
@@ -48,7 +64,7 @@ class OCRProvider(ABC):
     @abstractmethod
     async def extract_text(
         self,
-        content: bytes,
+        content: Content,
         filename: str,
         language: str = "kor"
     ) -> OCRResult:
@@ -66,6 +82,13 @@ class TesseractOCR(OCRProvider):
 
     def __init__(self):
         self._available = None
+        # Each page is a tesseract subprocess, so threads are enough to use
+        # several cores; a dedicated pool keeps OCR from crowding out the
+        # default executor (password hashing etc.)
+        self._page_pool = ThreadPoolExecutor(
+            max_workers=settings.OCR_MAX_WORKERS,
+            thread_name_prefix="ocr-page"
+        )
         logger.info("TesseractOCR provider initialized")
 
     async def is_available(self) -> bool:
@@ -84,7 +107,7 @@ class TesseractOCR(OCRProvider):
 
     async def extract_text(
         self,
-        content: bytes,
+        content: Content,
         filename: str,
         language: str = "kor"
     ) -> OCRResult:
@@ -100,39 +123,70 @@ class TesseractOCR(OCRProvider):
             raise OCRError(f"Required packages not installed: {e}")
 
         ext = Path(filename).suffix.lower()
-        all_text = []
-        total_pages = 1
 
         try:
             if ext == ".pdf":
-                # Convert PDF to images
-                images = pdf2image.convert_from_bytes(content)
-                total_pages = len(images)
-
-                for i, image in enumerate(images):
-                    text = pytesseract.image_to_string(image, lang=language)
-                    all_text.append(text)
-                    logger.debug(f"Processed PDF page {i + 1}/{total_pages}")
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    pages = await asyncio.to_thread(self._render_pdf, content, tmp_dir)
+                    return await self.extract_text_from_pages(pages, language)
 
-            elif ext in [".jpg", ".jpeg", ".png", ".tiff", ".bmp"]:
-                # Process image directly
-                image = Image.open(io.BytesIO(content))
-                text = pytesseract.image_to_string(image, lang=language)
-                all_text.append(text)
-
-            else:
-                raise OCRError(f"Unsupported file type: {ext}")
+            if ext in [".jpg", ".jpeg", ".png", ".tiff", ".bmp"]:
+                image = await asyncio.to_thread(Image.open, open_content(content))
+                with image:
+                    return await self.extract_text_from_pages([image], language)
 
+        except OCRError:
+            raise
         except Exception as e:
             logger.error(f"OCR extraction failed: {e}")
             raise OCRError(f"Text extraction failed: {str(e)}")
 
+        raise OCRError(f"Unsupported file type: {ext}")
+
+    @staticmethod
+    def _render_pdf(content: Content, tmp_dir: str) -> List[str]:
+        """
+        Render every page of a PDF into tmp_dir and return the page paths.
+
+        The PDF is copied to disk once and pdftoppm renders all pages in one
+        run, in grayscale (PGM: a third of the RGB bytes; Tesseract binarizes
+        anyway). Tesseract reads the page files itself, so pages are never
+        decoded into PIL images and re-encoded as PNG for pytesseract.
+        """
+        import pdf2image
+
+        pdf_path = Path(tmp_dir) / "document.pdf"
+        with open(pdf_path, "wb") as f:
+            shutil.copyfileobj(open_content(content), f)
+
+        return pdf2image.convert_from_path(
+            str(pdf_path),
+            output_folder=tmp_dir,
+            paths_only=True,
+            grayscale=True
+        )
+
+    async def extract_text_from_pages(self, pages: List, language: str = "kor") -> OCRResult:
+        """
+        Run Tesseract over pages (PIL images or image file paths) in parallel.
+
+        Pages are independent, so each goes to the OCR pool and the texts
+        are joined in page order.
+        """
+        import pytesseract
+
+        loop = asyncio.get_running_loop()
+        all_text = await asyncio.gather(*(
+            loop.run_in_executor(self._page_pool, pytesseract.image_to_string, page, language)
+            for page in pages
+        ))
+
         combined_text = "\n\n".join(all_text)
 
         return OCRResult(
             text=combined_text,
             confidence=0.85,  # Tesseract doesn't provide overall confidence
-            pages=total_pages,
+            pages=len(all_text),
             language=language,
             metadata={"provider": "tesseract"}
         )
@@ -149,7 +203,7 @@ class MockOCR(OCRProvider):
 
     async def extract_text(
         self,
-        content: bytes,
+        content: Content,
         filename: str,
         language: str = "kor"
     ) -> OCRResult:
@@ -201,7 +255,7 @@ class PDFTextExtractor:
     """Extract text directly from PDF (when OCR not needed)."""
 
     @staticmethod
-    async def extract(content: bytes) -> Optional[str]:
+    async def extract(content: Content) -> Optional[str]:
         """Extract text from PDF using PyPDF2 or similar."""
         try:
             import PyPDF2
@@ -209,8 +263,15 @@ class PDFTextExtractor:
             logger.warning("PyPDF2 not installed, skipping direct PDF extraction")
             return None
 
+        # PDF parsing is pure Python; run it off the event loop
+        return await asyncio.to_thread(PDFTextExtractor._extract_sync, content)
+
+    @staticmethod
+    def _extract_sync(content: Content) -> Optional[str]:
+        import PyPDF2
+
         try:
-            reader = PyPDF2.PdfReader(io.BytesIO(content))
+            reader = PyPDF2.PdfReader(open_content(content))
             text_parts = []
 
             for page in reader.pages:
@@ -255,7 +316,7 @@ class OCRService:
 
     async def extract_text(
         self,
-        content: bytes,
+        content: Content,
         filename: str,
         language: str = "kor",
         force_ocr: bool = False
@@ -264,7 +325,7 @@ class OCRService:
         Extract text from document or image.
 
         Args:
-            content: File content as bytes
+            content: File content as bytes or a seekable file
             filename: Original filename with extension
             language: OCR language (default: Korean)
             force_ocr: Force OCR even for text PDFs
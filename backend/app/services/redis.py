@@ -1,11 +1,22 @@
 """Redis connection service for caching and token blacklisting."""
-from typing import Optional
+from typing import Optional, Any
+import asyncio
+import hashlib
+import time
+import orjson
 import redis.asyncio as redis
 from app.core.config import settings
 import structlog
 
 logger = structlog.get_logger()
 
+# Pub/sub channel announcing newly blacklisted token hashes to every worker
+BLACKLIST_CHANNEL = "blacklist:events"
+
+# Expired mirror entries are swept at most this often; lookups already
+# ignore them, so they only cost memory until then
+BLACKLIST_PRUNE_INTERVAL_SECONDS = 60.0
+
 
 class RedisService:
     """Redis service for caching and session management."""
@@ -13,6 +24,13 @@ class RedisService:
     _instance: Optional["RedisService"] = None
     _client: Optional[redis.Redis] = None
 
+    # Local mirror of blacklisted token hashes (hash -> monotonic expiry),
+    # trusted only while the pub/sub listener is running
+    _blacklisted: dict[str, float] = {}
+    _blacklist_synced: bool = False
+    _blacklist_pruned_at: float = 0.0
+    _blacklist_listener: Optional[asyncio.Task] = None
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -21,15 +39,21 @@ class RedisService:
     async def connect(self) -> None:
         """Initialize Redis connection."""
         if self._client is None:
+            # A same-host Unix socket skips TCP loopback overhead
+            url = (
+                f"unix://{settings.REDIS_UNIX_SOCKET}"
+                if settings.REDIS_UNIX_SOCKET
+                else settings.REDIS_URL
+            )
             try:
                 self._client = redis.from_url(
-                    settings.REDIS_URL,
+                    url,
                     encoding="utf-8",
                     decode_responses=True
                 )
                 # Test connection
                 await self._client.ping()
-                logger.info("redis_connected", url=settings.REDIS_URL)
+                logger.info("redis_connected", url=url)
             except Exception as e:
                 logger.error("redis_connection_failed", error=str(e))
                 self._client = None
@@ -37,6 +61,7 @@ class RedisService:
 
     async def disconnect(self) -> None:
         """Close Redis connection."""
+        await self.stop_blacklist_sync()
         if self._client:
             await self._client.close()
             self._client = None
@@ -58,14 +83,95 @@ class RedisService:
             return False
 
     # Token blacklist operations
+    @staticmethod
+    def _token_digest(token: str) -> str:
+        # Hash the JWT so keys stay short and fixed-size
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @classmethod
+    def _blacklist_key(cls, token: str) -> str:
+        return f"blacklist:{cls._token_digest(token)}"
+
+    def _remember_blacklisted(self, digest: str, expires_in: int) -> None:
+        """Record a blacklisted hash locally, pruning expired entries periodically."""
+        now = time.monotonic()
+        self._blacklisted[digest] = now + expires_in
+
+        if now - self._blacklist_pruned_at < BLACKLIST_PRUNE_INTERVAL_SECONDS:
+            return
+        self._blacklist_pruned_at = now
+        for expired in [d for d, expires_at in self._blacklisted.items() if expires_at < now]:
+            del self._blacklisted[expired]
+
+    def _known_not_blacklisted(self, digest: str) -> bool:
+        """True when the local mirror can vouch the token is not revoked."""
+        if not self._blacklist_synced:
+            return False
+        expires_at = self._blacklisted.get(digest)
+        return expires_at is None or expires_at < time.monotonic()
+
+    async def start_blacklist_sync(self) -> None:
+        """
+        Mirror the token blacklist in process memory.
+
+        Subscribes before scanning existing keys so no blacklisting is
+        missed in between. While the listener runs, tokens absent from the
+        mirror skip the Redis blacklist lookup.
+        """
+        if self._client is None or self._blacklist_listener is not None:
+            return
+
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(BLACKLIST_CHANNEL)
+
+        # TTL of pre-existing keys is bounded by the access token lifetime
+        expires_in = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        async for key in self._client.scan_iter(match="blacklist:*", count=1000):
+            self._remember_blacklisted(key.split(":", 1)[1], expires_in)
+
+        self._blacklist_listener = asyncio.create_task(
+            self._listen_blacklist(pubsub), name="blacklist-sync"
+        )
+        self._blacklist_synced = True
+        logger.info("redis_blacklist_sync_started", known=len(self._blacklisted))
+
+    async def stop_blacklist_sync(self) -> None:
+        """Stop the blacklist listener and fall back to Redis lookups."""
+        self._blacklist_synced = False
+        if self._blacklist_listener is not None:
+            self._blacklist_listener.cancel()
+            await asyncio.gather(self._blacklist_listener, return_exceptions=True)
+            self._blacklist_listener = None
+
+    async def _listen_blacklist(self, pubsub) -> None:
+        """Apply blacklist events published by any worker."""
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                digest, _, expires_in = message["data"].partition(":")
+                self._remember_blacklisted(digest, int(expires_in))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("redis_blacklist_sync_failed", error=str(e))
+        finally:
+            # Without the listener the mirror may miss revocations
+            self._blacklist_synced = False
+            await pubsub.reset()
+
     async def blacklist_token(self, token: str, expires_in: int) -> bool:
         """Add token to blacklist with expiration."""
         if self._client is None:
             logger.warning("redis_not_available", operation="blacklist_token")
             return False
         try:
-            key = f"blacklist:{token}"
-            await self._client.setex(key, expires_in, "1")
+            digest = self._token_digest(token)
+            self._remember_blacklisted(digest, expires_in)
+            pipe = self._client.pipeline(transaction=False)
+            pipe.setex(f"blacklist:{digest}", expires_in, "1")
+            pipe.publish(BLACKLIST_CHANNEL, f"{digest}:{expires_in}")
+            await pipe.execute()
             return True
         except Exception as e:
             logger.error("redis_blacklist_failed", error=str(e))
@@ -76,13 +182,38 @@ class RedisService:
         if self._client is None:
             return False
         try:
-            key = f"blacklist:{token}"
-            result = await self._client.get(key)
-            return result is not None
+            digest = self._token_digest(token)
+            if self._known_not_blacklisted(digest):
+                return False
+            return bool(await self._client.exists(f"blacklist:{digest}"))
         except Exception as e:
             logger.error("redis_check_blacklist_failed", error=str(e))
             return False
 
+    async def check_auth(self, token: str, user_id: Any) -> tuple[bool, Optional[dict]]:
+        """
+        Check the token blacklist and fetch the cached user in one round-trip.
+        The blacklist lookup is skipped when the local mirror already
+        knows the token is not revoked.
+        Returns (is_blacklisted, cached_user_payload).
+        """
+        if self._client is None:
+            return False, None
+        try:
+            digest = self._token_digest(token)
+            if self._known_not_blacklisted(digest):
+                blacklisted = False
+                cached = await self._client.get(self._user_cache_key(user_id))
+            else:
+                pipe = self._client.pipeline(transaction=False)
+                pipe.exists(f"blacklist:{digest}")
+                pipe.get(self._user_cache_key(user_id))
+                blacklisted, cached = await pipe.execute()
+            return bool(blacklisted), orjson.loads(cached) if cached is not None else None
+        except Exception as e:
+            logger.error("redis_check_auth_failed", error=str(e))
+            return False, None
+
     # Rate limiting operations
     async def check_rate_limit(
         self,
@@ -155,6 +286,43 @@ class RedisService:
             logger.error("redis_cache_delete_failed", error=str(e))
             return False
 
+    # User cache operations
+    @staticmethod
+    def _user_cache_key(user_id: Any) -> str:
+        return f"user:{user_id}"
+
+    async def get_user_cache(self, user_id: Any) -> Optional[dict]:
+        """Get cached user payload."""
+        if self._client is None:
+            return None
+        try:
+            data = await self._client.get(self._user_cache_key(user_id))
+            return orjson.loads(data) if data is not None else None
+        except Exception as e:
+            logger.error("redis_user_cache_get_failed", error=str(e))
+            return None
+
+    async def set_user_cache(self, user_id: Any, payload: dict, ttl: int) -> bool:
+        """Cache user payload with expiration."""
+        if self._client is None:
+            return False
+        try:
+            await self._client.setex(self._user_cache_key(user_id), ttl, orjson.dumps(payload))
+            return True
+        except Exception as e:
+            logger.error("redis_user_cache_set_failed", error=str(e))
+            return False
+
+    async def invalidate_user_cache(self, user_id: Any) -> bool:
+        """
+        Drop cached user payload after the user row changes.
+
+        Call only after the change is committed: a request that misses the
+        cache before then reads the old row and would cache it again for
+        USER_CACHE_TTL_SECONDS.
+        """
+        return await self.cache_delete(self._user_cache_key(user_id))
+
 
 # Global instance
 redis_service = RedisService()
@@ -1,10 +1,12 @@
 """Storage service for file handling with S3/MinIO and local fallback."""
 import os
 import uuid
+import asyncio
 import hashlib
+import tempfile
 import aiofiles
 from pathlib import Path
-from typing import Optional, BinaryIO, Union
+from typing import Optional, BinaryIO, Union, AsyncIterator, Awaitable, Callable, Tuple
 from datetime import datetime
 
 from app.core.config import settings
@@ -23,6 +25,33 @@ def compute_file_hash(content: bytes) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
+async def iter_bytes(content: bytes) -> AsyncIterator[bytes]:
+    """Present in-memory content as a single-chunk stream."""
+    yield content
+
+
+async def copy_chunks(
+    chunks: AsyncIterator[bytes],
+    write: Callable[[bytes], Awaitable],
+    max_size: Optional[int] = None
+) -> Tuple[int, str]:
+    """
+    Pass each chunk to write, hashing as it goes.
+
+    Returns (size, sha256 hex). Raises StorageError once the stream
+    passes max_size, so oversized uploads are never fully buffered.
+    """
+    hasher = hashlib.sha256()
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if max_size is not None and size > max_size:
+            raise StorageError(f"File too large. Max size: {max_size // (1024*1024)}MB")
+        hasher.update(chunk)
+        await write(chunk)
+    return size, hasher.hexdigest()
+
+
 def generate_storage_path(filename: str, user_id: str = None) -> str:
     """Generate a unique storage path for a file."""
     ext = Path(filename).suffix.lower()
@@ -49,19 +78,31 @@ class LocalStorage:
         content_type: str = None
     ) -> dict:
         """Upload file to local storage."""
+        return await self.upload_stream(iter_bytes(content), path, content_type)
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        path: str,
+        content_type: str = None,
+        max_size: Optional[int] = None
+    ) -> dict:
+        """Write a chunk stream to local storage; a partial file is removed on error."""
         file_path = self.base_dir / path
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(content)
-
-        file_hash = compute_file_hash(content)
+        try:
+            async with aiofiles.open(file_path, "wb") as f:
+                size, file_hash = await copy_chunks(chunks, f.write, max_size)
+        except BaseException:
+            file_path.unlink(missing_ok=True)
+            raise
 
         logger.info(f"File uploaded locally: {path}")
 
         return {
             "path": path,
-            "size": len(content),
+            "size": size,
             "hash": file_hash,
             "content_type": content_type,
             "url": f"/uploads/{path}"
@@ -100,6 +141,9 @@ class LocalStorage:
 class S3Storage:
     """S3/MinIO storage provider."""
 
+    # Streamed uploads stay in memory up to this size before spilling to disk
+    SPOOL_MAX_SIZE = 2 * 1024 * 1024
+
     def __init__(self):
         self._client = None
         self._bucket = settings.S3_BUCKET_NAME
@@ -167,6 +211,50 @@ class S3Storage:
             "url": await self.get_url(path)
         }
 
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        path: str,
+        content_type: str = None,
+        max_size: Optional[int] = None
+    ) -> dict:
+        """
+        Upload a chunk stream to S3.
+
+        Chunks are spooled (in memory up to SPOOL_MAX_SIZE, then to a temp
+        file) and sent with upload_fileobj, which switches to multipart for
+        large files, so the upload is never held in memory as one buffer.
+        """
+        client = await self._get_client()
+
+        extra_args = {}
+        if content_type:
+            extra_args["ContentType"] = content_type
+
+        with tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE) as spool:
+            async def write(chunk: bytes) -> None:
+                await asyncio.to_thread(spool.write, chunk)
+
+            size, file_hash = await copy_chunks(chunks, write, max_size)
+            spool.seek(0)
+
+            await client.upload_fileobj(
+                spool,
+                self._bucket,
+                path,
+                ExtraArgs=extra_args or None
+            )
+
+        logger.info(f"File uploaded to S3: {path}")
+
+        return {
+            "path": path,
+            "size": size,
+            "hash": file_hash,
+            "content_type": content_type,
+            "url": await self.get_url(path)
+        }
+
     async def download(self, path: str) -> bytes:
         """Download file from S3."""
         client = await self._get_client()
@@ -245,9 +333,22 @@ class StorageService:
         filename: str,
         user_id: str = None,
         content_type: str = None
+    ) -> dict:
+        """Upload in-memory content; see upload_stream for the returned metadata."""
+        return await self.upload_stream(iter_bytes(content), filename, user_id, content_type)
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        user_id: str = None,
+        content_type: str = None
     ) -> dict:
         """
-        Upload a file and return metadata.
+        Upload a file from a stream of chunks and return metadata.
+
+        The content is hashed and size-checked while it is written, so
+        memory use is bounded by the chunk size rather than the file size.
 
         Returns:
             {
@@ -261,12 +362,6 @@ class StorageService:
                 "uploaded_at": str
             }
         """
-        # Validate file size
-        if len(content) > settings.MAX_FILE_SIZE:
-            raise StorageError(
-                f"File too large. Max size: {settings.MAX_FILE_SIZE // (1024*1024)}MB"
-            )
-
         # Validate file extension
         ext = Path(filename).suffix.lower().lstrip(".")
         if ext not in settings.ALLOWED_EXTENSIONS:
@@ -277,8 +372,13 @@ class StorageService:
         # Generate storage path
         storage_path = generate_storage_path(filename, user_id)
 
-        # Upload to provider
-        result = await self._provider.upload(content, storage_path, content_type)
+        # Upload to provider; the size limit is enforced mid-stream
+        result = await self._provider.upload_stream(
+            chunks,
+            storage_path,
+            content_type,
+            max_size=settings.MAX_FILE_SIZE
+        )
 
         return {
             "id": str(uuid.uuid4()),
@@ -0,0 +1,138 @@
+"""Batched B2B API usage counting."""
+import asyncio
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.base import async_session_maker
+from app.models.subscription import UsageRecord
+
+logger = get_logger("usage_tracker")
+
+
+class PeriodBounds(NamedTuple):
+    """A monthly billing period, with ISO strings ready for responses."""
+    start: datetime
+    end: datetime
+    start_iso: str
+    end_iso: str
+
+
+@lru_cache(maxsize=512)
+def period_bounds(year: int, month: int) -> PeriodBounds:
+    """Billing period for a calendar month; computed once per month."""
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return PeriodBounds(start, end, start.isoformat(), end.isoformat())
+
+
+def current_period() -> PeriodBounds:
+    """Billing period containing the current UTC time."""
+    now = datetime.utcnow()
+    return period_bounds(now.year, now.month)
+
+
+class ApiUsageRecorder:
+    """
+    Counts API calls in memory and adds them to usage_records per interval.
+
+    Endpoints only bump a counter, so the request no longer waits on a
+    SELECT and UPDATE; each flush is a single upsert against the
+    (user_id, period_start) unique constraint.
+    """
+
+    def __init__(
+        self,
+        interval: float = None,
+        session_factory: async_sessionmaker[AsyncSession] = None
+    ):
+        self.interval = interval or settings.API_USAGE_FLUSH_INTERVAL_SECONDS
+        self._session_factory = session_factory or async_session_maker
+        self._pending: defaultdict[tuple[UUID, datetime], int] = defaultdict(int)
+        # Current period start and its end in epoch seconds, so record() only
+        # compares floats until the month rolls over
+        self._period_start: Optional[datetime] = None
+        self._period_end_ts = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of API calls waiting to be written."""
+        return sum(self._pending.values())
+
+    def record(self, user_id: UUID, calls: int = 1) -> None:
+        """Count API calls for user_id in the current billing month."""
+        if time.time() >= self._period_end_ts:
+            period = current_period()
+            self._period_start = period.start
+            self._period_end_ts = period.end.replace(tzinfo=timezone.utc).timestamp()
+        self._pending[(user_id, self._period_start)] += calls
+
+    def start(self) -> None:
+        """Start the periodic flush task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="api-usage-recorder")
+
+    async def stop(self) -> None:
+        """Stop the flush task and write anything still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Add buffered counts to usage_records. Returns calls written."""
+        if not self._pending:
+            return 0
+
+        # Swapped without awaiting, so calls recorded during the write land in the new buffer
+        pending, self._pending = self._pending, defaultdict(int)
+
+        try:
+            async with self._session_factory() as db:
+                await db.execute(self._upsert_statement(pending))
+                await db.commit()
+        except Exception as e:
+            # Usage feeds billing, so keep the counts for the next flush
+            for key, calls in pending.items():
+                self._pending[key] += calls
+            logger.error("api_usage_flush_failed", users=len(pending), error=str(e))
+            return 0
+
+        return sum(pending.values())
+
+    @staticmethod
+    def _upsert_statement(pending: dict[tuple[UUID, datetime], int]):
+        """One INSERT ... ON CONFLICT adding every buffered count."""
+        stmt = insert(UsageRecord).values([
+            {
+                "user_id": user_id,
+                "period_start": period_start,
+                "period_end": period_bounds(period_start.year, period_start.month).end,
+                "api_calls": calls
+            }
+            for (user_id, period_start), calls in pending.items()
+        ])
+        return stmt.on_conflict_do_update(
+            index_elements=[UsageRecord.user_id, UsageRecord.period_start],
+            set_={"api_calls": UsageRecord.api_calls + stmt.excluded.api_calls}
+        )
+
+    async def _run(self) -> None:
+        """Flush on a fixed interval until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+
+# Singleton instance
+api_usage_recorder = ApiUsageRecorder()
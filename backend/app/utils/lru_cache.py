@@ -0,0 +1,63 @@
+"""In-process LRU cache for memoizing hot-path results."""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with optional per-entry TTL.
+
+    Operations never await, so the cache is safe to share between
+    coroutines on the same event loop without a lock.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid (None = no expiry)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[Any, Optional[float]]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return cached value for key, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value for key, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove key from the cache if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_MISSING = object()
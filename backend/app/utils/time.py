@@ -0,0 +1,18 @@
+"""UTC timestamps for the naive UTC DateTime columns used throughout the models."""
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """
+    Current UTC time as a naive datetime.
+
+    Same value as the deprecated datetime.utcnow() (3.12+). Columns are
+    `timestamp without time zone`, which asyncpg rejects aware values for,
+    so the tzinfo is dropped rather than kept.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def utcfromtimestamp(timestamp: float) -> datetime:
+    """Naive UTC datetime for a POSIX timestamp; replaces datetime.utcfromtimestamp()."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
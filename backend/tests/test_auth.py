@@ -1,6 +1,15 @@
 """Tests for authentication endpoints."""
+import uuid
+from datetime import datetime
+
+import orjson
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.exc import InvalidRequestError
+
+from app.api.auth import user_to_cache, user_from_cache
+from app.models.user import User, AuthLevel, SubscriptionTier
+from app.schemas.auth import UserResponse
 
 
 class TestAuthRegister:
@@ -210,3 +219,62 @@ class TestAuthUpdate:
         data = response.json()
         assert data["business_type"] == "Technology"
         assert data["business_description"] == "AI startup"
+
+
+class TestUserCache:
+    """Tests for the Redis user cache payload used by get_current_user."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_restores_typed_columns(self, async_session):
+        """Test cached users come back with UUID, enum and datetime values."""
+        user = User(
+            id=uuid.uuid4(),
+            email="cached@example.com",
+            password_hash="not-cached",
+            name="Cached User",
+            auth_level=AuthLevel.DID,
+            subscription_tier=SubscriptionTier.PRO,
+            email_verified=True,
+            created_at=datetime(2024, 1, 2, 3, 4, 5),
+        )
+
+        payload = orjson.loads(orjson.dumps(user_to_cache(user)))
+        assert "password_hash" not in payload["user"]
+
+        restored = user_from_cache(async_session, payload)
+        assert restored.id == user.id
+        assert restored.auth_level is AuthLevel.DID
+        assert restored.subscription_tier is SubscriptionTier.PRO
+        assert restored.created_at == user.created_at
+        assert restored.email_verified is True
+        assert restored in async_session
+
+    @pytest.mark.asyncio
+    async def test_relationships_raise_instead_of_lazy_loading(self, async_session):
+        """Test a cached user's relationships raise rather than emit SQL."""
+        user = User(id=uuid.uuid4(), email="lazy@example.com", name="Lazy User")
+        restored = user_from_cache(async_session, orjson.loads(orjson.dumps(user_to_cache(user))))
+
+        for key in ("user_did", "contracts"):
+            with pytest.raises(InvalidRequestError):
+                getattr(restored, key)
+
+
+class TestUserResponse:
+    """Tests for UserResponse construction."""
+
+    def test_from_orm_fast_matches_model_validate(self):
+        """Test the unvalidated fast path produces the same payload."""
+        user = User(
+            id=uuid.uuid4(),
+            email="fast@example.com",
+            name="Fast User",
+            auth_level=AuthLevel.VERIFIED,
+            subscription_tier=SubscriptionTier.BASIC,
+            business_type="Freelancer",
+            email_verified=False,
+            created_at=datetime(2024, 5, 6, 7, 8, 9),
+        )
+
+        assert UserResponse.from_orm_fast(user).model_dump(mode="json") == \
+            UserResponse.model_validate(user).model_dump(mode="json")
@@ -0,0 +1,89 @@
+"""Tests for B2B API key verification."""
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete
+
+from app.api import b2b
+from app.models.api_key import ApiKey
+
+
+async def add_api_key(db, user, **values) -> str:
+    """Store a new API key for user and return the raw key."""
+    api_key = b2b.generate_api_key()
+    db.add(ApiKey(
+        user_id=user.id,
+        name="test",
+        key_hash=b2b.hash_api_key(api_key),
+        key_prefix=b2b.get_key_prefix(api_key),
+        scopes=["contracts:read"],
+        **values
+    ))
+    await db.commit()
+    return api_key
+
+
+class TestVerifyApiKey:
+    """Tests for verify_api_key and its verified-key cache."""
+
+    def setup_method(self):
+        b2b.verified_api_key_cache.clear()
+        b2b.unknown_api_key_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_repeat_verification_uses_cache(self, async_session, test_user):
+        """Test a verified key is served from the cache without the DB row."""
+        api_key = await add_api_key(async_session, test_user)
+
+        verified = await b2b.verify_api_key(api_key, async_session)
+        assert verified.user_id == test_user.id
+        assert verified.has_scope("contracts:read")
+        assert not verified.has_scope("contracts:write")
+
+        await async_session.execute(delete(ApiKey))
+        assert await b2b.verify_api_key(api_key, async_session) is verified
+
+    @pytest.mark.asyncio
+    async def test_unknown_key_rejected(self, async_session):
+        """Test an unknown key is rejected and not cached."""
+        with pytest.raises(HTTPException) as exc_info:
+            await b2b.verify_api_key("sc_live_unknown", async_session)
+
+        assert exc_info.value.status_code == 401
+        assert len(b2b.verified_api_key_cache) == 0
+        assert b2b.hash_api_key("sc_live_unknown") in b2b.unknown_api_key_cache
+
+    @pytest.mark.asyncio
+    async def test_cached_key_expires(self, async_session, test_user):
+        """Test expiry is enforced for keys already in the cache."""
+        api_key = await add_api_key(async_session, test_user)
+        verified = await b2b.verify_api_key(api_key, async_session)
+        verified.expires_at_ts = time.time() - 1
+
+        with pytest.raises(HTTPException) as exc_info:
+            await b2b.verify_api_key(api_key, async_session)
+
+        assert exc_info.value.detail == "API key expired"
+
+
+class TestContractCursor:
+    """Tests for the keyset pagination cursor."""
+
+    def test_cursor_round_trip(self):
+        """Test a cursor decodes to the contract's created_at and id."""
+        contract = SimpleNamespace(created_at=datetime(2024, 5, 1, 12, 0, 0, 123456), id=uuid4())
+
+        cursor = b2b.encode_contract_cursor(contract)
+
+        assert b2b.decode_contract_cursor(cursor) == (contract.created_at, contract.id)
+
+    def test_malformed_cursor_rejected(self):
+        """Test a malformed cursor is a 400, not a server error."""
+        with pytest.raises(HTTPException) as exc_info:
+            b2b.decode_contract_cursor("not-a-cursor")
+
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,77 @@
+"""Tests for Merkle tree helpers in the blockchain API."""
+import hashlib
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.blockchain import (
+    merkle_root,
+    merkle_root_with_proofs,
+    parse_document_hashes,
+)
+from app.services.certificate import CertificateService
+
+
+def leaf(n: int) -> bytes:
+    return hashlib.sha256(str(n).encode()).digest()
+
+
+def root_from_proof(digest: bytes, proof: list) -> bytes:
+    """Fold a proof back up to the root it claims."""
+    node = digest
+    for step in proof:
+        sibling = bytes.fromhex(step["hash"])
+        pair = node + sibling if step["position"] == "right" else sibling + node
+        node = hashlib.sha256(pair).digest()
+    return node
+
+
+class TestMerkleTree:
+    """Tests for merkle_root and merkle_root_with_proofs."""
+
+    def test_two_leaf_root(self):
+        """Test the root of two leaves hashes their raw concatenation."""
+        assert merkle_root([leaf(1), leaf(2)]) == hashlib.sha256(leaf(1) + leaf(2)).digest()
+
+    @pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13])
+    def test_every_proof_reaches_root(self, count):
+        """Test each leaf's proof folds back to the root-only result."""
+        leaves = [leaf(n) for n in range(count)]
+        root, proofs = merkle_root_with_proofs(leaves)
+
+        assert root == merkle_root(leaves)
+        assert len(proofs) == count
+        for digest, proof in zip(leaves, proofs):
+            assert root_from_proof(digest, proof) == root
+
+    def test_malformed_hash_rejected(self):
+        """Test non-hex or wrong-length hashes are a 400."""
+        for bad in ["zz" * 32, "ab" * 31]:
+            with pytest.raises(HTTPException) as exc_info:
+                parse_document_hashes([bad])
+            assert exc_info.value.status_code == 400
+
+
+class TestCertificatePdfQueue:
+    """Tests for CertificateService.can_queue_pdf."""
+
+    @pytest.mark.asyncio
+    async def test_no_backend_stops_queueing(self):
+        """Test polls stop queueing renders once no PDF library is found."""
+        service = CertificateService()
+        record_id = uuid.uuid4()
+        assert service.can_queue_pdf(record_id)
+
+        service.pdf_available = False
+
+        assert not service.can_queue_pdf(record_id)
+        assert await service.generate_and_store_pdf(record_id) is None
+
+    def test_render_in_progress_not_queued_again(self):
+        """Test an anchor already rendering is not queued twice."""
+        service = CertificateService()
+        record_id = uuid.uuid4()
+        service._rendering.add(record_id)
+
+        assert not service.can_queue_pdf(record_id)
@@ -2,6 +2,8 @@
 import pytest
 from httpx import AsyncClient
 
+from app.api.contracts import _decode_text
+
 
 class TestContractCreate:
     """Tests for POST /contracts endpoint."""
@@ -274,3 +276,19 @@ class TestContractDelete:
             headers=auth_headers,
         )
         assert response.status_code == 404
+
+
+class TestDecodeText:
+    """Tests for text upload decoding."""
+
+    def test_utf8_bom_stripped(self):
+        """Test UTF-8 text decodes with its byte order mark removed."""
+        assert _decode_text("\ufeff계약서".encode("utf-8")) == ("계약서", "completed")
+
+    def test_cp949_fallback(self):
+        """Test legacy Korean text falls back to cp949."""
+        assert _decode_text("계약서".encode("cp949")) == ("계약서", "completed")
+
+    def test_undecodable_text_fails(self):
+        """Test bytes invalid in every encoding mark OCR as failed."""
+        assert _decode_text(b"\xff\xff\xff") == (None, "failed")
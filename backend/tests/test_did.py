@@ -0,0 +1,66 @@
+"""Tests for DID API helpers."""
+import asyncio
+
+import pytest
+
+from app.api.did import cached_verify_did, verified_did_cache
+from app.services.did_baas import MockDidBaasClient, DidBaasError
+
+
+class CountingClient(MockDidBaasClient):
+    """Mock client that counts verify_did calls and yields once per call."""
+
+    def __init__(self, error: DidBaasError = None):
+        super().__init__()
+        self.calls = 0
+        self.error = error
+
+    async def verify_did(self, did_address: str):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.error:
+            raise self.error
+        return await super().verify_did(did_address)
+
+
+class TestCachedVerifyDid:
+    """Tests for cached_verify_did."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        verified_did_cache.clear()
+        yield
+        verified_did_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self):
+        """Test simultaneous verifications of one DID hit upstream once."""
+        client = CountingClient()
+
+        results = await asyncio.gather(*[
+            cached_verify_did(client, "did:sw:test:0xabc") for _ in range(5)
+        ])
+
+        assert client.calls == 1
+        assert all(result["valid"] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_result_served_from_cache(self):
+        """Test a repeat verification within the TTL skips upstream."""
+        client = CountingClient()
+
+        await cached_verify_did(client, "did:sw:test:0xabc")
+        await cached_verify_did(client, "did:sw:test:0xabc")
+
+        assert client.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self):
+        """Test upstream errors propagate and the next call retries."""
+        client = CountingClient(error=DidBaasError("unavailable", status_code=503))
+
+        for _ in range(2):
+            with pytest.raises(DidBaasError):
+                await cached_verify_did(client, "did:sw:test:0xabc")
+
+        assert client.calls == 2
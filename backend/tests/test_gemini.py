@@ -0,0 +1,54 @@
+"""Tests for Gemini client streaming."""
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.exceptions import AIServiceError
+from app.services.gemini import GeminiClient
+
+
+class FakeModels:
+    """Stand-in for client.aio.models, shaped like google-genai 0.3.0."""
+
+    def __init__(self, texts, error: Exception = None):
+        self.texts = texts
+        self.error = error
+
+    async def generate_content_stream(self, model, contents, config):
+        """Async generator, not a coroutine returning one."""
+        for text in self.texts:
+            yield SimpleNamespace(text=text)
+        if self.error:
+            raise self.error
+
+
+def make_client(texts, error: Exception = None) -> GeminiClient:
+    """Create a non-mock GeminiClient backed by a fake SDK client."""
+    client = GeminiClient(api_key="test-key")
+    client._client = SimpleNamespace(aio=SimpleNamespace(models=FakeModels(texts, error)))
+    return client
+
+
+class TestStreamContent:
+    """Tests for GeminiClient streaming methods."""
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_yields_chunks(self):
+        """Test chunks from the async generator are yielded in order, skipping empty ones."""
+        client = make_client(["Hello", "", None, " world"])
+
+        chunks = [text async for text in client.chat_stream("hi")]
+
+        assert chunks == ["Hello", " world"]
+
+    @pytest.mark.asyncio
+    async def test_stream_error_becomes_service_error(self):
+        """Test an SDK error mid-stream is raised as AIServiceError after earlier chunks."""
+        client = make_client(["partial"], error=RuntimeError("quota"))
+
+        chunks = []
+        with pytest.raises(AIServiceError):
+            async for text in client.chat_stream("hi"):
+                chunks.append(text)
+
+        assert chunks == ["partial"]
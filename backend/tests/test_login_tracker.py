@@ -0,0 +1,46 @@
+"""Tests for batched last-login writes."""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.user import User
+from app.services.login_tracker import LastLoginRecorder
+
+
+class TestLastLoginRecorder:
+    """Tests for LastLoginRecorder."""
+
+    def test_record_keeps_latest_per_user(self):
+        """Test repeated logins collapse into one pending entry."""
+        recorder = LastLoginRecorder(interval=60)
+        first = datetime(2024, 1, 1, 9, 0, tzinfo=timezone.utc).timestamp()
+        recorder.record("user-1", first)
+        recorder.record("user-1", first + 60)
+
+        assert recorder.pending_count == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_timestamps(self, async_engine, test_user):
+        """Test flush updates last_login_at and empties the buffer."""
+        session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+        recorder = LastLoginRecorder(interval=60, session_factory=session_factory)
+        logged_in_at = datetime(2024, 1, 1, 9, 30)
+        recorder.record(test_user.id, logged_in_at.replace(tzinfo=timezone.utc).timestamp())
+
+        assert await recorder.flush() == 1
+        assert recorder.pending_count == 0
+
+        async with session_factory() as db:
+            result = await db.execute(
+                select(User.last_login_at).where(User.id == test_user.id)
+            )
+            assert result.scalar_one() == logged_in_at
+
+    @pytest.mark.asyncio
+    async def test_flush_without_pending_is_noop(self):
+        """Test flushing an empty buffer does not touch the database."""
+        recorder = LastLoginRecorder(interval=60)
+
+        assert await recorder.flush() == 0
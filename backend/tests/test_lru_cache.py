@@ -0,0 +1,61 @@
+"""Tests for the in-process LRU cache utility."""
+import time
+
+from app.utils.lru_cache import LRUCache
+
+
+class TestLRUCache:
+    """Tests for LRUCache."""
+
+    def test_get_missing_returns_default(self):
+        """Test missing keys return the default."""
+        cache = LRUCache(maxsize=2)
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", "fallback") == "fallback"
+
+    def test_set_and_get(self):
+        """Test stored values are returned."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Touch "a" so "b" becomes least recently used
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_ttl_expiry(self):
+        """Test entries expire after their TTL."""
+        cache = LRUCache(maxsize=2, ttl=0.01)
+        cache.set("a", 1)
+
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_delete_and_clear(self):
+        """Test removing entries."""
+        cache = LRUCache(maxsize=4)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        cache.delete("not-there")
+        assert "a" not in cache
+
+        cache.clear()
+        assert len(cache) == 0
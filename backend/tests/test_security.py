@@ -0,0 +1,65 @@
+"""Tests for JWT helpers in app.core.security."""
+import hashlib
+import hmac
+import time
+
+from app.core import security
+from app.core.security import create_access_token, create_refresh_token, verify_token
+
+
+TOKEN_CLAIMS = {
+    "sub": "00000000-0000-0000-0000-000000000001",
+    "email": "token@example.com",
+    "auth_level": "basic",
+    "tier": "free",
+}
+
+
+class TestVerifyToken:
+    """Tests for verify_token and its verified-claims cache."""
+
+    def setup_method(self):
+        security.verified_token_cache.clear()
+
+    def test_repeat_verification_uses_cache(self):
+        """Test a second verification returns the cached claims."""
+        token = create_access_token(TOKEN_CLAIMS)
+
+        first = verify_token(token, "access")
+        second = verify_token(token, "access")
+
+        assert first is not None
+        assert second is first
+        assert first.user_id == TOKEN_CLAIMS["sub"]
+
+    def test_cached_token_type_is_respected(self):
+        """Test a verified access token is not accepted as a refresh token."""
+        token = create_access_token(TOKEN_CLAIMS)
+
+        assert verify_token(token, "access") is not None
+        assert verify_token(token, "refresh") is None
+
+    def test_cached_entry_expires_with_token(self, monkeypatch):
+        """Test cached claims are not returned after the token's exp."""
+        token = create_refresh_token(TOKEN_CLAIMS)
+        assert verify_token(token, "refresh") is not None
+
+        future = time.time() + 365 * 24 * 60 * 60
+        monkeypatch.setattr(security.time, "time", lambda: future)
+
+        assert verify_token(token, "refresh") is None
+
+
+class TestPrekeyedHMACKey:
+    """Tests for the pre-keyed JWT HMAC signer."""
+
+    def test_sign_matches_plain_hmac(self):
+        """Test copied HMAC state gives the same signature as hmac.new."""
+        key = security.PrekeyedHMACKey("k" * 32, "HS256")
+        message = b"header.payload"
+        expected = hmac.new(b"k" * 32, message, hashlib.sha256).digest()
+
+        assert key.sign(message) == expected
+        assert key.sign(message) == expected
+        assert key.verify(message, expected)
+        assert not key.verify(b"other", expected)
@@ -0,0 +1,46 @@
+"""Tests for streamed storage uploads."""
+import hashlib
+
+import pytest
+
+from app.services.storage import LocalStorage, StorageError
+
+
+async def chunked(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+class TestLocalStorageStream:
+    """Tests for LocalStorage.upload_stream."""
+
+    @pytest.mark.asyncio
+    async def test_stream_hashes_whole_file(self, tmp_path):
+        """Test chunks are written in order and hashed as one file."""
+        storage = LocalStorage(base_dir=str(tmp_path))
+
+        result = await storage.upload_stream(chunked(b"abc", b"def"), "docs/a.txt")
+
+        assert (tmp_path / "docs/a.txt").read_bytes() == b"abcdef"
+        assert result["size"] == 6
+        assert result["hash"] == hashlib.sha256(b"abcdef").hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_oversized_stream_removes_partial_file(self, tmp_path):
+        """Test passing max_size aborts the upload and leaves no file behind."""
+        storage = LocalStorage(base_dir=str(tmp_path))
+
+        with pytest.raises(StorageError):
+            await storage.upload_stream(chunked(b"abc", b"def"), "big.txt", max_size=4)
+
+        assert not (tmp_path / "big.txt").exists()
+
+    @pytest.mark.asyncio
+    async def test_bytes_upload_uses_stream(self, tmp_path):
+        """Test in-memory uploads report the same metadata as streams."""
+        storage = LocalStorage(base_dir=str(tmp_path))
+
+        result = await storage.upload(b"abcdef", "b.txt")
+
+        assert result["hash"] == hashlib.sha256(b"abcdef").hexdigest()
+        assert result["url"] == "/uploads/b.txt"
@@ -0,0 +1,50 @@
+"""Tests for batched B2B API usage counting."""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.subscription import UsageRecord
+from app.services.usage_tracker import ApiUsageRecorder, period_bounds
+
+
+class TestApiUsageRecorder:
+    """Tests for ApiUsageRecorder."""
+
+    def test_record_accumulates_per_user(self):
+        """Test repeated calls collapse into one pending counter."""
+        recorder = ApiUsageRecorder(interval=60)
+        recorder.record("user-1")
+        recorder.record("user-1")
+
+        assert recorder.pending_count == 2
+        assert len(recorder._pending) == 1
+
+    def test_period_bounds_wraps_year(self):
+        """Test the December period ends on January 1st."""
+        bounds = period_bounds(2024, 12)
+
+        assert bounds.start == datetime(2024, 12, 1)
+        assert bounds.end == datetime(2025, 1, 1)
+        assert bounds.end_iso == "2025-01-01T00:00:00"
+
+    @pytest.mark.asyncio
+    async def test_flush_inserts_then_increments(self, async_engine, test_user):
+        """Test the first flush creates the record and later ones add to it."""
+        session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+        recorder = ApiUsageRecorder(interval=60, session_factory=session_factory)
+
+        recorder.record(test_user.id)
+        recorder.record(test_user.id)
+        assert await recorder.flush() == 2
+
+        recorder.record(test_user.id)
+        assert await recorder.flush() == 1
+        assert recorder.pending_count == 0
+
+        async with session_factory() as db:
+            result = await db.execute(
+                select(UsageRecord.api_calls).where(UsageRecord.user_id == test_user.id)
+            )
+            assert result.scalar_one() == 3